@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from pandas.api.types import union_categoricals
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import matplotlib.pyplot as plt
@@ -7,7 +8,343 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import re
 from datetime import datetime
 import os
+import io
+import hashlib
 import tempfile
+import stat
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from rapidfuzz import process as fuzz_process # Optional: suggests near-miss invoice numbers
+    from rapidfuzz.distance import JaroWinkler
+except ImportError:
+    fuzz_process = None
+
+try:
+    import re2 as gstin_regex_engine # google-re2 is optional; its DFA matcher never backtracks
+except ImportError:
+    gstin_regex_engine = re
+
+try:
+    import xlsxwriter # Optional: faster Excel writer; openpyxl is used without it
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import pyarrow # noqa: F401 -- optional: Arrow-backed storage for the free-text key columns
+    # NaN-semantics Arrow strings keep isna/mask/np.select behaving exactly like the NumPy columns
+    ARROW_STRING_DTYPE = pd.StringDtype('pyarrow', na_value=np.nan)
+except (ImportError, TypeError):
+    ARROW_STRING_DTYPE = None # pyarrow missing, or a pandas release without NaN-semantics string dtypes
+
+# Structure of a valid 15-character GSTIN: state code, PAN, entity number, 'Z', checksum
+GSTIN_PATTERN = r'[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}'
+GSTIN_RE = gstin_regex_engine.compile(GSTIN_PATTERN) # Compiled once at import time
+
+# Leading zeros of each digit run in an invoice number ('INV/007' -> 'INV/7')
+INVOICE_ZERO_PAD_RE = re.compile(r'(?<![0-9])0+(?=[0-9])')
+
+# Row background colours in the reconciliation result tabs, keyed by Treeview tag
+RESULT_TAG_COLOURS = {
+    'missing': '#ffdddd',
+    'mismatch': '#fff3c4',
+    'duplicate': '#e4e4f7'
+}
+
+# Cleaned imports are cached as Parquet in a per-user folder (%LOCALAPPDATA%\GSTRecon\cache on Windows,
+# $XDG_CACHE_HOME/gst_recon or ~/.cache/gst_recon elsewhere), readable only by the current user.
+# Each source file keeps only its latest entry, and at most IMPORT_CACHE_MAX_FILES entries are kept,
+# least recently used removed first
+if os.name == 'nt':
+    IMPORT_CACHE_DIR = os.path.join(os.environ.get('LOCALAPPDATA') or tempfile.gettempdir(), 'GSTRecon', 'cache')
+else:
+    IMPORT_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'gst_recon')
+IMPORT_CACHE_MAX_FILES = 20
+
+LOG_MAX_LINES = 2000 # Entries kept in the log area
+LOG_FLUSH_MS = 200 # How often queued log entries are written to the log area
+LOG_ENTRY_FORMAT = '[{:02d}:{:02d}:{:02d}] {}\n'.format # hour, minute, second, message; avoids strftime per entry
+
+# Expected standard column names mapped to the common header variations seen in exports
+STANDARD_COLUMNS_MAP = {
+    'invoice_no': ['invoice no', 'invoiceno', 'bill no', 'billno', 'invoice'],
+    'invoice_date': ['invoice date', 'invoicedate', 'bill date', 'billdate', 'date'],
+    'supplier_gstin': ['supplier gstin', 'suppliergstin', 'gstin', 'party gstin', 'receiver gstin'],
+    'taxable_value': ['taxable value', 'taxablevalue', 'value', 'net amount'],
+    'cgst': ['cgst', 'central tax'],
+    'sgst': ['sgst', 'state tax'],
+    'igst': ['igst', 'integrated tax'],
+    'total_amount': ['total amount', 'totalamount', 'amount', 'gross amount'],
+    'place_of_supply': ['place of supply', 'placeofsupply', 'pos']
+}
+BOOK_ENTRY_DATE_VARIATIONS = ['book entry date', 'bookentrydate', 'entry date', 'accounting date']
+
+# Treeview display column -> internal DataFrame column
+# This mapping should be consistent with `clean_and_transform_data`
+DISPLAY_TO_INTERNAL_COLUMNS = {
+    "Invoice No": "invoice_no",
+    "Invoice Date": "invoice_date",
+    "Supplier GSTIN": "supplier_gstin",
+    "Taxable Value": "taxable_value",
+    "CGST": "cgst",
+    "SGST": "sgst",
+    "IGST": "igst",
+    "Total Amount": "total_amount",
+    "Place of Supply": "place_of_supply",
+    "Book Entry Date": "book_entry_date", # Only for books
+    "Source": "source", # For reconciliation results
+    "Issue Type": "issue_type", # For reconciliation results
+    "GSTR-2A Date": "gstr_2a_date", # For reconciliation results (internal name might differ)
+    "Books Date": "books_date", # For reconciliation results (internal name might differ)
+    "GSTR-2A GSTIN": "gstr_2a_gstin", # For reconciliation results
+    "Books GSTIN": "books_gstin", # For reconciliation results
+    "Amount Diff": "amount_diff", # For reconciliation results
+    "Tax Diff": "tax_diff", # For reconciliation results
+    "Details": "details" # For reconciliation results
+}
+
+class KeepOnlyTable(dict):
+    """
+    str.translate table that deletes every character not accepted by keep.
+    Decisions are memoized per code point, so cleaning is a C-level character loop
+    instead of a regex substitution.
+    """
+    def __init__(self, keep):
+        super().__init__()
+        self.keep = keep
+
+    def __missing__(self, code):
+        value = code if self.keep(chr(code)) else None
+        self[code] = value
+        return value
+
+ALNUM_UPPER_TABLE = KeepOnlyTable(lambda ch: 'A' <= ch <= 'Z' or '0' <= ch <= '9') # Same as [^A-Z0-9] removal
+ALNUM_LOWER_TABLE = KeepOnlyTable(lambda ch: 'a' <= ch <= 'z' or '0' <= ch <= '9') # Same as [^a-z0-9] removal
+DIGITS_TABLE = KeepOnlyTable(lambda ch: '0' <= ch <= '9') # Same as [^0-9] removal
+NUMERIC_TABLE = KeepOnlyTable(lambda ch: ch.isdecimal() or ch == '.') # Same as [^\d.] removal
+
+def normalize_column_name(name):
+    """Normalizes a header the way clean_and_transform_data does: lowercase alphanumerics only."""
+    return str(name).strip().lower().translate(ALNUM_LOWER_TABLE)
+
+def format_ddmmyyyy(dates):
+    """
+    Formats a datetime Series as dd/mm/yyyy strings, with '' for missing dates.
+    Invoice dates repeat heavily, so each distinct date is formatted once and
+    the labels are gathered back by factorized code.
+    """
+    codes, uniques = pd.factorize(dates)
+    labels = np.append(uniques.strftime('%d/%m/%Y').to_numpy(dtype=object), '') # Code -1 (NaT) picks ''
+    return pd.Series(labels[codes], index=dates.index)
+
+class VirtualTreeview:
+    """
+    Wraps a ttk.Treeview and only renders the rows currently visible in the viewport.
+    All data stays in a backing pandas DataFrame; scrolling swaps the visible rows in place,
+    so the number of Tk item operations is bounded by the viewport height, not the dataset size.
+    """
+    def __init__(self, master, height=12, **kwargs):
+        self.tree = ttk.Treeview(master, height=height, **kwargs)
+        self.df = pd.DataFrame()
+        self.formatter = None # Callable turning a DataFrame slice into a list of row values
+        self.tagger = None # Optional callable turning a DataFrame slice into a list of per-row tag tuples
+        self.first_visible = 0
+        self.visible_count = height
+        self._yscrollcommand = None
+        # Selection is kept as positions in the backing DataFrame, so it survives rows scrolling out of view
+        self._selected = set()
+        self._anchor = None # Where a Shift-click or Shift-arrow range starts
+        self._focus_index = None # The row moved by the arrow keys
+
+        # Scrolling is driven by the backing DataFrame, not by Tk's own item list
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel) # Windows / macOS
+        self.tree.bind("<Button-4>", lambda event: self._scroll_by(-3)) # X11 wheel up
+        self.tree.bind("<Button-5>", lambda event: self._scroll_by(3)) # X11 wheel down
+        
+        # Clicks and keys select by DataFrame position instead of Treeview's built-in per-item selection
+        self.tree.bind("<ButtonPress-1>", lambda event: self._on_click(event, 'set'))
+        self.tree.bind("<Control-ButtonPress-1>", lambda event: self._on_click(event, 'toggle'))
+        self.tree.bind("<Shift-ButtonPress-1>", lambda event: self._on_click(event, 'extend'))
+        self.tree.bind("<Up>", lambda event: self._move_focus(-1, 'set'))
+        self.tree.bind("<Down>", lambda event: self._move_focus(1, 'set'))
+        self.tree.bind("<Shift-Up>", lambda event: self._move_focus(-1, 'extend'))
+        self.tree.bind("<Shift-Down>", lambda event: self._move_focus(1, 'extend'))
+        self.tree.bind("<Prior>", lambda event: self._scroll_by(-self.visible_count)) # Page Up
+        self.tree.bind("<Next>", lambda event: self._scroll_by(self.visible_count)) # Page Down
+        self.tree.bind("<Home>", lambda event: self._scroll_by(-len(self.df)))
+        self.tree.bind("<End>", lambda event: self._scroll_by(len(self.df)))
+
+    def __getattr__(self, name):
+        # Delegate everything else (grid, heading, column, selection, item, ...) to the Treeview
+        return getattr(self.tree, name)
+
+    def __getitem__(self, key):
+        return self.tree[key]
+
+    def configure(self, **kwargs):
+        """Configures the wrapped Treeview, keeping the vertical scroll callback for ourselves."""
+        if 'yscrollcommand' in kwargs:
+            self._yscrollcommand = kwargs.pop('yscrollcommand')
+        if kwargs:
+            self.tree.configure(**kwargs)
+
+    config = configure
+
+    def set_dataframe(self, df, formatter=None, tagger=None):
+        """Replaces the backing DataFrame and renders the first page of rows."""
+        self.df = df
+        if formatter is not None:
+            self.formatter = formatter
+        if tagger is not None:
+            self.tagger = tagger
+        self.first_visible = 0
+        # Item ids are reused across DataFrames, so drop every item (and the selection) first
+        self._selected = set()
+        self._anchor = self._focus_index = None
+        self.tree.selection_remove(self.tree.selection())
+        self.tree.delete(*self.tree.get_children())
+        self.render()
+
+    def extend_dataframe(self, df):
+        """
+        Swaps in a DataFrame that only has rows appended to the current one.
+        The scroll position and the rows already on screen are kept; only rows
+        that now fit into the viewport are inserted.
+        """
+        self.df = df
+        self.render()
+
+    def render(self):
+        """
+        Brings the Treeview in line with the current viewport. Rows that stay visible
+        after a scroll are kept as they are; only rows entering or leaving are touched.
+        """
+        first = self.first_visible
+        part = self.df.iloc[first:first + self.visible_count]
+        # Item ids are positional indices into the backing DataFrame
+        wanted = [str(first + offset) for offset in range(len(part))]
+        wanted_set = set(wanted)
+
+        current = self.tree.get_children()
+        stale = [iid for iid in current if iid not in wanted_set]
+        if stale:
+            self.tree.delete(*stale)
+        kept = set(current).difference(stale)
+
+        if len(kept) < len(wanted):
+            # Format the whole (small) slice up front so no pandas work interleaves with Tk calls
+            rows = self.formatter(part) if self.formatter else part.itertuples(index=False, name=None)
+            # Tags are assigned at insert time; their styles are configured once on the Treeview
+            tags = self.tagger(part) if self.tagger else [()] * len(part)
+            for position, (iid, values, row_tags) in enumerate(zip(wanted, rows, tags)):
+                if iid not in kept:
+                    self.tree.insert("", position, iid=iid, values=list(values), tags=row_tags)
+
+        self._show_selection()
+        self._update_scrollbar()
+
+    def selection(self):
+        """Returns the item ids (DataFrame positions) of all selected rows, including rows scrolled out of view."""
+        return tuple(str(index) for index in sorted(self._selected))
+
+    def _show_selection(self):
+        """Mirrors the selection and focus onto the rows currently in the viewport."""
+        first, last = self.first_visible, min(self.first_visible + self.visible_count, len(self.df))
+        visible_selected = [str(index) for index in range(first, last) if index in self._selected]
+        if set(visible_selected) != set(self.tree.selection()):
+            self.tree.selection_set(visible_selected)
+        if self._focus_index is not None and first <= self._focus_index < last and self.tree.exists(str(self._focus_index)):
+            self.tree.focus(str(self._focus_index))
+
+    def _select(self, index, mode):
+        """Updates the selection for a click or arrow key on a row: 'set', 'toggle' or 'extend' (Shift range)."""
+        if mode == 'extend' and self._anchor is not None:
+            low, high = sorted((self._anchor, index))
+            self._selected = set(range(low, high + 1))
+        elif mode == 'toggle':
+            self._selected ^= {index}
+            self._anchor = index
+        else:
+            self._selected = {index}
+            self._anchor = index
+        self._focus_index = index
+        
+        # Bring the row into view, as Treeview does when the focus moves past the viewport
+        if index < self.first_visible:
+            self._scroll_to(index)
+        elif index >= self.first_visible + self.visible_count:
+            self._scroll_to(index - self.visible_count + 1)
+        self._show_selection()
+
+    def _on_click(self, event, mode):
+        if self.tree.identify_region(event.x, event.y) not in ('cell', 'tree'):
+            return None # Headings and column separators keep their default behaviour
+        iid = self.tree.identify_row(event.y)
+        if not iid:
+            return None
+        self.tree.focus_set()
+        self._select(int(iid), mode)
+        return "break"
+
+    def _move_focus(self, delta, mode):
+        if self.df.empty:
+            return "break"
+        if self._focus_index is None:
+            index = self.first_visible # Nothing focused yet: start from the top of the viewport
+        else:
+            index = min(max(0, self._focus_index + delta), len(self.df) - 1)
+        self._select(index, mode)
+        return "break"
+
+    def yview(self, *args):
+        """Scrollbar command handler; mirrors the Treeview.yview protocol over the backing DataFrame."""
+        total = len(self.df)
+        if not args:
+            return self._fractions()
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * total))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if len(args) > 2 and args[2] == 'pages':
+                amount *= self.visible_count
+            self._scroll_by(amount)
+
+    def _fractions(self):
+        total = len(self.df)
+        if total == 0:
+            return 0.0, 1.0
+        return self.first_visible / total, min(1.0, (self.first_visible + self.visible_count) / total)
+
+    def _update_scrollbar(self):
+        if self._yscrollcommand:
+            self._yscrollcommand(*self._fractions())
+
+    def _scroll_to(self, first):
+        max_first = max(0, len(self.df) - self.visible_count)
+        first = min(max(0, first), max_first)
+        if first != self.first_visible:
+            self.first_visible = first
+            self.render()
+
+    def _scroll_by(self, amount):
+        self._scroll_to(self.first_visible + amount)
+        return "break"
+
+    def _on_mousewheel(self, event):
+        # event.delta is a multiple of 120 on Windows and small integers on macOS
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_configure(self, event):
+        # Recompute how many rows fit when the widget is resized
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        visible_count = max(1, event.height // row_height - 1) # Minus the heading row
+        if visible_count != self.visible_count:
+            self.visible_count = visible_count
+            self.render()
 
 class GSTReconciliationApp:
     """
@@ -25,6 +362,12 @@ class GSTReconciliationApp:
         self.amount_tolerance = 1.0  # Rupees
         self.auto_clean_gstin = True
         
+        # Worker threads for file parsing and reconciliation, so the UI does not freeze
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._running = {} # Job name ('gstr2a', 'books', 'reconciliation') -> future still in flight
+        self._closing = False
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Configure application style
         self.style = ttk.Style()
         self.style.configure("TNotebook.Tab", font=('Arial', 10, 'bold'), padding=[10, 5])
@@ -40,7 +383,12 @@ class GSTReconciliationApp:
         # Initialize log text area early so log_message can be called from the start
         self.log_text = scrolledtext.ScrolledText(root, height=10, wrap=tk.WORD) 
         self.log_text.config(state=tk.DISABLED) # Make logs read-only initially
+        self.log_text.tag_config("error", foreground="red") # Error messages are displayed in red
         # Note: self.log_text is created here, but will be packed into its frame in create_settings_tab
+        
+        # log_message only queues entries; they are written to the widget in batches every LOG_FLUSH_MS
+        self._log_buf = deque(maxlen=LOG_MAX_LINES)
+        self._flush_log_loop()
 
         # Try to set application icon (handle potential errors if icon file is missing)
         try:
@@ -55,17 +403,43 @@ class GSTReconciliationApp:
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill='both', expand=True, padx=15, pady=15)
         
+        # Imported frames and manual entries (cleaned dicts) are buffered and combined with a
+        # single concat the next time the data is read
+        self._gstr2a_chunks = []
+        self._books_chunks = []
+        self._gstr2a_manual_rows = []
+        self._books_manual_rows = []
+        # Pending preview/stats refresh per source: None, 'append' or 'full' (after deletes and
+        # clears). Bursts of imports, adds and deletes are coalesced into one refresh on idle
+        self._ui_dirty = {'gstr2a': None, 'books': None}
+        self._ui_flush_scheduled = False
+        # Bumped whenever a dataset is replaced or grows, so derived views can tell whether they are stale
+        self._data_versions = {'gstr2a': 0, 'books': 0}
+        # Identities (path, mtime, size) of the files imported into each dataset, so importing the
+        # very same file again can be confirmed with the user first
+        self._gstr2a_files = set()
+        self._books_files = set()
+        # The data summary dialog is built once and hidden on close, then refilled on reopen
+        self._summary_dialog = None
+        self._summary_text = None
+        self._summary_sections = {} # Source -> (data version, summary lines) from the last time it was shown
+        
+        # Typed empty datasets with the cleaned schema, built once and copied whenever data is cleared
+        string_dtype = ARROW_STRING_DTYPE or str
+        base_dtypes = {
+            'invoice_no': string_dtype, 'invoice_date': 'datetime64[ns]', 'supplier_gstin': 'category',
+            'taxable_value': float, 'cgst': float, 'sgst': float, 'igst': float, 'total_amount': float,
+            'place_of_supply': 'category'
+        }
+        self._empty_gstr2a = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in
+                                           {**base_dtypes, 'match_key': string_dtype}.items()})
+        self._empty_books = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in
+                                          {**base_dtypes, 'book_entry_date': 'datetime64[ns]', 'match_key': string_dtype}.items()})
+        
         # Initialize data containers as empty pandas DataFrames
         # Ensure they have the expected columns from the start to prevent KeyError later
-        self.gstr2a_data = pd.DataFrame(columns=[
-            'invoice_no', 'invoice_date', 'supplier_gstin', 'taxable_value', 
-            'cgst', 'sgst', 'igst', 'total_amount', 'place_of_supply', 'match_key'
-        ])
-        self.books_data = pd.DataFrame(columns=[
-            'invoice_no', 'invoice_date', 'supplier_gstin', 'taxable_value', 
-            'cgst', 'sgst', 'igst', 'total_amount', 'place_of_supply', 
-            'book_entry_date', 'match_key'
-        ])
+        self.gstr2a_data = self._empty_gstr2a.copy()
+        self.books_data = self._empty_books.copy()
         self.reconciliation_results = None # To store reconciliation output
         
         # Create all application tabs
@@ -83,6 +457,12 @@ class GSTReconciliationApp:
         # Store Excel template paths for future reference
         self.gstr2a_template_path = None
         self.books_template_path = None
+        # Finished template workbooks, built once on first download and reused afterwards
+        self._gstr2a_template_bytes = None
+        self._books_template_bytes = None
+        # Whether the last downloaded template is known to still exist on disk
+        self._gstr2a_template_valid = False
+        self._books_template_valid = False
 
     # --- TAB CREATION METHODS ---
     def create_gstr2a_tab(self):
@@ -144,7 +524,7 @@ class GSTReconciliationApp:
         # Define columns for the Treeview
         columns = ("Invoice No", "Invoice Date", "Supplier GSTIN", "Taxable Value", 
                    "CGST", "SGST", "IGST", "Total Amount", "Place of Supply")
-        self.gstr2a_tree = ttk.Treeview(preview_frame, columns=columns, show="headings", height=12)
+        self.gstr2a_tree = VirtualTreeview(preview_frame, columns=columns, show="headings", height=12)
         
         # Add scrollbars to the Treeview
         vsb = ttk.Scrollbar(preview_frame, orient="vertical", command=self.gstr2a_tree.yview)
@@ -233,7 +613,7 @@ class GSTReconciliationApp:
         # Define columns for the Treeview
         columns = ("Invoice No", "Invoice Date", "Supplier GSTIN", "Taxable Value", 
                    "CGST", "SGST", "IGST", "Total Amount", "Place of Supply", "Book Entry Date")
-        self.books_tree = ttk.Treeview(preview_frame, columns=columns, show="headings", height=12)
+        self.books_tree = VirtualTreeview(preview_frame, columns=columns, show="headings", height=12)
         
         # Add scrollbars to the Treeview
         vsb = ttk.Scrollbar(preview_frame, orient="vertical", command=self.books_tree.yview)
@@ -311,7 +691,7 @@ class GSTReconciliationApp:
         
         columns = ("Invoice No", "Invoice Date", "Supplier GSTIN", "Taxable Value", 
                    "CGST", "SGST", "IGST", "Total Amount", "Place of Supply")
-        self.gstr2a_manual_tree = ttk.Treeview(preview_frame, columns=columns, show="headings", height=12)
+        self.gstr2a_manual_tree = VirtualTreeview(preview_frame, columns=columns, show="headings", height=12)
         
         # Add scrollbars
         vsb = ttk.Scrollbar(preview_frame, orient="vertical", command=self.gstr2a_manual_tree.yview)
@@ -386,7 +766,7 @@ class GSTReconciliationApp:
         
         columns = ("Invoice No", "Invoice Date", "Supplier GSTIN", "Taxable Value", 
                    "CGST", "SGST", "IGST", "Total Amount", "Place of Supply", "Book Entry Date")
-        self.books_manual_tree = ttk.Treeview(preview_frame, columns=columns, show="headings", height=12)
+        self.books_manual_tree = VirtualTreeview(preview_frame, columns=columns, show="headings", height=12)
         
         # Add scrollbars
         vsb = ttk.Scrollbar(preview_frame, orient="vertical", command=self.books_manual_tree.yview)
@@ -425,7 +805,9 @@ class GSTReconciliationApp:
         ttk.Label(control_frame, textvariable=self.recon_status, foreground="blue", 
                  font=('Arial', 10, 'bold')).grid(row=0, column=1, padx=5, pady=5, sticky='w')
         
-        ttk.Button(control_frame, text="Run Reconciliation", command=self.run_reconciliation).grid(row=0, column=2, padx=10)
+        # Kept so it can be disabled while a reconciliation is running
+        self.run_recon_button = ttk.Button(control_frame, text="Run Reconciliation", command=self.run_reconciliation)
+        self.run_recon_button.grid(row=0, column=2, padx=10)
         ttk.Button(control_frame, text="Export Results", command=self.export_results).grid(row=0, column=3, padx=10)
         ttk.Button(control_frame, text="Show Data Summary", command=self.show_data_summary).grid(row=0, column=4, padx=10)
         
@@ -456,7 +838,10 @@ class GSTReconciliationApp:
             # Create Treeview for each discrepancy type
             columns = ("Invoice No", "Source", "Issue Type", "GSTR-2A Date", "Books Date", 
                        "GSTR-2A GSTIN", "Books GSTIN", "Amount Diff", "Tax Diff", "Details")
-            tree = ttk.Treeview(frame, columns=columns, show="headings", height=15)
+            tree = VirtualTreeview(frame, columns=columns, show="headings", height=15)
+            # Colour-code rows by discrepancy kind; styles are set up once per tree
+            for tag, colour in RESULT_TAG_COLOURS.items():
+                tree.tag_configure(tag, background=colour)
             
             # Add scrollbars
             vsb = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
@@ -490,8 +875,11 @@ class GSTReconciliationApp:
         
         # Create a figure and subplots for charts
         self.fig, self.axs = plt.subplots(2, 2, figsize=(12, 10))
-        self.fig.tight_layout(pad=5.0) # Adjust layout to prevent overlap
+        # Fix the margins once, leaving room for rotated tick labels, so refreshes
+        # do not have to re-measure every text artist via tight_layout
+        self.fig.subplots_adjust(left=0.08, right=0.97, top=0.95, bottom=0.12, hspace=0.6, wspace=0.3)
         self.canvas = FigureCanvasTkAgg(self.fig, master=charts_frame)
+        self._chart_signatures = {} # What each panel currently shows, so unchanged panels are not redrawn
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Frame for summary report (scrolled text)
@@ -553,33 +941,29 @@ class GSTReconciliationApp:
     # --- EXCEL TEMPLATE METHODS ---
     def download_gstr2a_template(self):
         """Generates and downloads an Excel template for GSTR-2A data."""
-        columns = [
-            'Invoice No', 'Invoice Date', 'Supplier GSTIN', 
-            'Taxable Value', 'CGST', 'SGST', 'IGST', 
-            'Total Amount', 'Place of Supply'
-        ]
-        df = pd.DataFrame(columns=columns)
-        
-        # Create a temporary file path for the template
-        # Using tempfile.mkstemp to get a unique file name and path securely
-        fd, self.gstr2a_template_path = tempfile.mkstemp(suffix='_GSTR2A_Template.xlsx')
-        os.close(fd) # Close the file descriptor immediately as we will use pandas to write
-        
-        # Save the empty DataFrame to Excel
-        df.to_excel(self.gstr2a_template_path, index=False)
+        if self._gstr2a_template_bytes is None:
+            columns = [
+                'Invoice No', 'Invoice Date', 'Supplier GSTIN', 
+                'Taxable Value', 'CGST', 'SGST', 'IGST', 
+                'Total Amount', 'Place of Supply'
+            ]
+            # Sample data shown in the template
+            sample_data = [
+                ['INV-2023-001', '15/07/2023', '22AAAAA0000A1Z5', 10000.00, 900.00, 900.00, 0.00, 11800.00, '07'],
+                ['INV-2023-002', '18/07/2023', '33BBBBB0000B2Z6', 15000.00, 1350.00, 1350.00, 0.00, 17700.00, '07']
+            ]
+            df = pd.DataFrame(sample_data, columns=columns)
+            
+            # Build the workbook in memory once; later downloads just copy the cached bytes
+            buffer = io.BytesIO()
+            self._write_excel(df, buffer)
+            self._gstr2a_template_bytes = buffer.getvalue()
         
-        # Add sample data to the template
-        sample_data = [
-            ['INV-2023-001', '15/07/2023', '22AAAAA0000A1Z5', 10000.00, 900.00, 900.00, 0.00, 11800.00, '07'],
-            ['INV-2023-002', '18/07/2023', '33BBBBB0000B2Z6', 15000.00, 1350.00, 1350.00, 0.00, 17700.00, '07']
-        ]
-        sample_df = pd.DataFrame(sample_data, columns=columns)
-        # Use openpyxl engine to append data to an existing sheet
-        try:
-            with pd.ExcelWriter(self.gstr2a_template_path, engine='openpyxl', mode='a', if_sheet_exists='overlay') as writer:
-                sample_df.to_excel(writer, sheet_name='Sheet1', index=False, startrow=1, header=False)
-        except Exception as e:
-            self.log_message(f"Error adding sample data to GSTR-2A template: {e}", error=True)
+        # Create a uniquely named temporary file holding the cached template
+        with tempfile.NamedTemporaryFile(suffix='_GSTR2A_Template.xlsx', delete=False) as handle:
+            handle.write(self._gstr2a_template_bytes)
+        self.gstr2a_template_path = handle.name
+        self._gstr2a_template_valid = True
 
         self.log_message(f"GSTR-2A template created at: {self.gstr2a_template_path}")
         messagebox.showinfo("Template Created", 
@@ -587,14 +971,18 @@ class GSTReconciliationApp:
     
     def open_gstr2a_template(self):
         """Opens the downloaded GSTR-2A template."""
-        if not self.gstr2a_template_path or not os.path.exists(self.gstr2a_template_path):
+        # Trust the flag set by the last download and only stat the file when it is unknown
+        if not self._gstr2a_template_valid:
+            self._gstr2a_template_valid = bool(self.gstr2a_template_path) and os.path.isfile(self.gstr2a_template_path)
+        if not self._gstr2a_template_valid:
             self.log_message("GSTR-2A template not found, attempting to download.", error=False)
             self.download_gstr2a_template() # Download if not already present
         
-        if self.gstr2a_template_path and os.path.exists(self.gstr2a_template_path):
+        if self._gstr2a_template_valid:
             try:
                 os.startfile(self.gstr2a_template_path) # Open the file using default application
             except Exception as e:
+                self._gstr2a_template_valid = False # The file may have been removed; stat it again next time
                 messagebox.showerror("Error", f"Could not open the template file: {e}. Please try again.")
                 self.log_message(f"Error opening GSTR-2A template: {e}", error=True)
         else:
@@ -603,32 +991,29 @@ class GSTReconciliationApp:
 
     def download_books_template(self):
         """Generates and downloads an Excel template for Books data."""
-        columns = [
-            'Invoice No', 'Invoice Date', 'Supplier GSTIN', 
-            'Taxable Value', 'CGST', 'SGST', 'IGST', 
-            'Total Amount', 'Place of Supply', 'Book Entry Date'
-        ]
-        df = pd.DataFrame(columns=columns)
-        
-        # Create a temporary file path for the template
-        fd, self.books_template_path = tempfile.mkstemp(suffix='_Books_Template.xlsx')
-        os.close(fd) # Close the file descriptor immediately
-        
-        # Save the empty DataFrame to Excel
-        df.to_excel(self.books_template_path, index=False)
+        if self._books_template_bytes is None:
+            columns = [
+                'Invoice No', 'Invoice Date', 'Supplier GSTIN', 
+                'Taxable Value', 'CGST', 'SGST', 'IGST', 
+                'Total Amount', 'Place of Supply', 'Book Entry Date'
+            ]
+            # Sample data shown in the template
+            sample_data = [
+                ['INV-2023-001', '15/07/2023', '22AAAAA0000A1Z5', 10000.00, 900.00, 900.00, 0.00, 11800.00, '07', '17/07/2023'],
+                ['INV-2023-003', '20/07/2023', '44CCCCC0000C3Z7', 20000.00, 1800.00, 1800.00, 0.00, 23600.00, '07', '22/07/2023']
+            ]
+            df = pd.DataFrame(sample_data, columns=columns)
+            
+            # Build the workbook in memory once; later downloads just copy the cached bytes
+            buffer = io.BytesIO()
+            self._write_excel(df, buffer)
+            self._books_template_bytes = buffer.getvalue()
         
-        # Add sample data to the template
-        sample_data = [
-            ['INV-2023-001', '15/07/2023', '22AAAAA0000A1Z5', 10000.00, 900.00, 900.00, 0.00, 11800.00, '07', '17/07/2023'],
-            ['INV-2023-003', '20/07/2023', '44CCCCC0000C3Z7', 20000.00, 1800.00, 1800.00, 0.00, 23600.00, '07', '22/07/2023']
-        ]
-        sample_df = pd.DataFrame(sample_data, columns=columns)
-        # Use openpyxl engine to append data to an existing sheet
-        try:
-            with pd.ExcelWriter(self.books_template_path, engine='openpyxl', mode='a', if_sheet_exists='overlay') as writer:
-                sample_df.to_excel(writer, sheet_name='Sheet1', index=False, startrow=1, header=False)
-        except Exception as e:
-            self.log_message(f"Error adding sample data to Books template: {e}", error=True)
+        # Create a uniquely named temporary file holding the cached template
+        with tempfile.NamedTemporaryFile(suffix='_Books_Template.xlsx', delete=False) as handle:
+            handle.write(self._books_template_bytes)
+        self.books_template_path = handle.name
+        self._books_template_valid = True
 
         self.log_message(f"Books template created at: {self.books_template_path}")
         messagebox.showinfo("Template Created", 
@@ -636,20 +1021,82 @@ class GSTReconciliationApp:
     
     def open_books_template(self):
         """Opens the downloaded Books template."""
-        if not self.books_template_path or not os.path.exists(self.books_template_path):
+        # Trust the flag set by the last download and only stat the file when it is unknown
+        if not self._books_template_valid:
+            self._books_template_valid = bool(self.books_template_path) and os.path.isfile(self.books_template_path)
+        if not self._books_template_valid:
             self.log_message("Books template not found, attempting to download.", error=False)
             self.download_books_template() # Download if not already present
         
-        if self.books_template_path and os.path.exists(self.books_template_path):
+        if self._books_template_valid:
             try:
                 os.startfile(self.books_template_path) # Open the file using default application
             except Exception as e:
+                self._books_template_valid = False # The file may have been removed; stat it again next time
                 messagebox.showerror("Error", f"Could not open the template file: {e}. Please try again.")
                 self.log_message(f"Error opening Books template: {e}", error=True)
         else:
             messagebox.showerror("Error", "Books template could not be created or found.")
             self.log_message("Failed to open Books template: File not available.", error=True)
     
+    def _write_excel(self, df, file_path):
+        """Writes a DataFrame to a single-sheet Excel file (a path or a binary file handle)."""
+        self._write_excel_sheets(file_path, {'Sheet1': df})
+
+    def _write_excel_sheets(self, file_path, sheets):
+        """
+        Writes each DataFrame in sheets (sheet name -> DataFrame) to its own sheet of one Excel
+        file, preferring the faster xlsxwriter engine. Datetime columns may be passed as they are. Rows are written
+        straight to the worksheet; without xlsxwriter they are streamed through a write-only openpyxl workbook,
+        which never builds the full cell graph in memory. A sheet may also be given as a plain list of
+        rows (header first) for small text sheets that need no DataFrame.
+        """
+        if xlsxwriter is not None:
+            # Invoice numbers and details are plain text; skip xlsxwriter's per-string URL detection.
+            # Datetime cells are written as real Excel dates shown as dd/mm/yyyy
+            options = {'strings_to_urls': False, 'default_date_format': 'dd/mm/yyyy', 'nan_inf_to_errors': True}
+            # Rows are written strictly top to bottom, so files on disk can be streamed: each finished
+            # row is flushed instead of the whole sheet being held in memory. In-memory templates stay buffered
+            options['constant_memory'] = isinstance(file_path, (str, os.PathLike))
+            with xlsxwriter.Workbook(file_path, options) as wb:
+                header_format = wb.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}) # As pandas writes headers
+                two_decimals = wb.add_format({'num_format': '0.00'})
+                for sheet_name, df in sheets.items():
+                    ws = wb.add_worksheet(sheet_name)
+                    if not isinstance(df, pd.DataFrame):
+                        ws.write_row(0, 0, df[0], header_format)
+                        for row_number, row in enumerate(df[1:], start=1):
+                            ws.write_row(row_number, 0, row)
+                        continue
+                    ws.write_row(0, 0, list(df.columns), header_format)
+                    # Amounts are stored as numbers and displayed with two decimals
+                    for position, dtype in enumerate(df.dtypes):
+                        if pd.api.types.is_float_dtype(dtype):
+                            ws.set_column(position, position, None, two_decimals)
+                    # Missing values become empty cells, as with pandas' own writers
+                    rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+                    for row_number, row in enumerate(rows, start=1):
+                        ws.write_row(row_number, 0, row)
+            return
+        
+        from openpyxl import Workbook
+        wb = Workbook(write_only=True)
+        for sheet_name, df in sheets.items():
+            ws = wb.create_sheet(sheet_name)
+            if not isinstance(df, pd.DataFrame):
+                for row in df:
+                    ws.append(list(row))
+                continue
+            ws.append(list(df.columns))
+            # Write-only cells carry no number format, so show dates as dd/mm/yyyy text instead
+            datetime_cols = df.select_dtypes(include='datetime').columns
+            if len(datetime_cols):
+                df = df.assign(**{col: format_ddmmyyyy(df[col]) for col in datetime_cols})
+            # Missing values become empty cells, as with pandas' own writers
+            for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+                ws.append(list(row))
+        wb.save(file_path)
+
     # --- DATA IMPORT METHODS ---
     def browse_gstr2a_file(self):
         """Opens a file dialog to select the GSTR-2A data file."""
@@ -672,40 +1119,48 @@ class GSTReconciliationApp:
             self.log_message(f"Selected Books file: {file_path}")
 
     def load_gstr2a_data(self):
-        """Loads and processes GSTR-2A data from the selected file."""
+        """Loads and processes GSTR-2A data from the selected file on a background thread."""
         file_path = self.gstr2a_file_path.get()
         if not file_path or not os.path.exists(file_path):
             messagebox.showerror("Error", "Please select a valid file first.")
             self.log_message("No GSTR-2A file selected or file does not exist.", error=True)
             return
         
-        try:
-            # Read file based on extension
-            if file_path.lower().endswith(('.csv')):
-                df = pd.read_csv(file_path)
-            elif file_path.lower().endswith(('.xlsx', '.xls')):
-                df = pd.read_excel(file_path)
-            else:
-                messagebox.showerror("Error", "Unsupported file format. Please select an Excel or CSV file.")
-                self.log_message("Unsupported GSTR-2A file format.", error=True)
-                return
+        if not file_path.lower().endswith(('.csv', '.xlsx', '.xls')):
+            messagebox.showerror("Error", "Unsupported file format. Please select an Excel or CSV file.")
+            self.log_message("Unsupported GSTR-2A file format.", error=True)
+            return
+        
+        # Get custom mapping from UI entries (Tk variables must be read on the main thread)
+        custom_mapping = {key: var.get().strip() for key, var in self.gstr2a_mapping_vars.items() if var.get().strip()}
+        
+        if 'gstr2a' in self._running:
+            messagebox.showinfo("Info", "A GSTR-2A file is still loading. Please wait for it to finish.")
+            return
+        
+        # Importing the same unchanged file twice would double every row, so confirm it first.
+        # Rows repeated across different files are kept; they are reported as duplicates
+        file_id = self._file_identity(file_path)
+        if file_id in self._gstr2a_files and not messagebox.askyesno(
+                "Already Imported", "This file has already been imported and has not changed since.\n"
+                "Import it again? Its rows will be added a second time."):
+            self.log_message(f"Skipped re-importing unchanged GSTR-2A file: {file_path}")
+            return
+        
+        self.status_var.set("Loading GSTR-2A data...")
+        self.run_in_background('gstr2a', self._load_file_worker, lambda future: self._apply_gstr2a_load(future, file_id),
+                               file_path, "GSTR-2A", custom_mapping)
 
-            self.log_message(f"Loaded GSTR-2A file with {len(df)} records.")
-            
-            # Get custom mapping from UI entries
-            custom_mapping = {key: var.get().strip() for key, var in self.gstr2a_mapping_vars.items() if var.get().strip()}
-            
-            # Clean and transform the loaded data
-            df = self.clean_and_transform_data(df, "GSTR-2A", custom_mapping)
+    def _apply_gstr2a_load(self, future, file_id):
+        """Stores freshly loaded GSTR-2A data and refreshes the UI (runs on the main thread)."""
+        try:
+            df = future.result()
             
-            # Concatenate with existing GSTR-2A data
-            # Use pd.concat with ignore_index=True to handle cases where initial DFs are empty
-            self.gstr2a_data = pd.concat([self.gstr2a_data, df], ignore_index=True)
+            # Queue for the next combined read of the GSTR-2A data
+            self._gstr2a_chunks.append(df)
+            self._gstr2a_files.add(file_id)
             
-            # Update UI elements
-            self.update_treeview(self.gstr2a_tree, self.gstr2a_data) # Update main GSTR-2A preview
-            self.update_treeview(self.gstr2a_manual_tree, self.gstr2a_data) # Also update manual tree as it shows combined data
-            self.update_gstr2a_stats()
+            self.schedule_ui_refresh('gstr2a') # Update both previews and the stats once idle
             
             self.log_message(f"Successfully processed {len(df)} GSTR-2A records.")
             messagebox.showinfo("Success", "GSTR-2A data loaded successfully.")
@@ -715,39 +1170,48 @@ class GSTReconciliationApp:
             messagebox.showerror("Error", f"Failed to load GSTR-2A data: {str(e)}")
 
     def load_books_data(self):
-        """Loads and processes Books of Accounts data from the selected file."""
+        """Loads and processes Books of Accounts data from the selected file on a background thread."""
         file_path = self.books_file_path.get()
         if not file_path or not os.path.exists(file_path):
             messagebox.showerror("Error", "Please select a valid file first.")
             self.log_message("No Books file selected or file does not exist.", error=True)
             return
         
+        if not file_path.lower().endswith(('.csv', '.xlsx', '.xls')):
+            messagebox.showerror("Error", "Unsupported file format. Please select an Excel or CSV file.")
+            self.log_message("Unsupported Books file format.", error=True)
+            return
+        
+        # Get custom mapping from UI entries (Tk variables must be read on the main thread)
+        custom_mapping = {key: var.get().strip() for key, var in self.books_mapping_vars.items() if var.get().strip()}
+        
+        if 'books' in self._running:
+            messagebox.showinfo("Info", "A Books file is still loading. Please wait for it to finish.")
+            return
+        
+        # Importing the same unchanged file twice would double every row, so confirm it first.
+        # Rows repeated across different files are kept; they are reported as duplicates
+        file_id = self._file_identity(file_path)
+        if file_id in self._books_files and not messagebox.askyesno(
+                "Already Imported", "This file has already been imported and has not changed since.\n"
+                "Import it again? Its rows will be added a second time."):
+            self.log_message(f"Skipped re-importing unchanged Books file: {file_path}")
+            return
+        
+        self.status_var.set("Loading Books data...")
+        self.run_in_background('books', self._load_file_worker, lambda future: self._apply_books_load(future, file_id),
+                               file_path, "Books", custom_mapping)
+
+    def _apply_books_load(self, future, file_id):
+        """Stores freshly loaded Books data and refreshes the UI (runs on the main thread)."""
         try:
-            # Read file based on extension
-            if file_path.lower().endswith(('.csv')):
-                df = pd.read_csv(file_path)
-            elif file_path.lower().endswith(('.xlsx', '.xls')):
-                df = pd.read_excel(file_path)
-            else:
-                messagebox.showerror("Error", "Unsupported file format. Please select an Excel or CSV file.")
-                self.log_message("Unsupported Books file format.", error=True)
-                return
-            
-            self.log_message(f"Loaded Books file with {len(df)} records.")
-            
-            # Get custom mapping from UI entries
-            custom_mapping = {key: var.get().strip() for key, var in self.books_mapping_vars.items() if var.get().strip()}
-            
-            # Clean and transform the loaded data
-            df = self.clean_and_transform_data(df, "Books", custom_mapping)
+            df = future.result()
             
-            # Concatenate with existing Books data
-            self.books_data = pd.concat([self.books_data, df], ignore_index=True)
+            # Queue for the next combined read of the Books data
+            self._books_chunks.append(df)
+            self._books_files.add(file_id)
             
-            # Update UI elements
-            self.update_treeview(self.books_tree, self.books_data) # Update main Books preview
-            self.update_treeview(self.books_manual_tree, self.books_data) # Also update manual tree
-            self.update_books_stats()
+            self.schedule_ui_refresh('books') # Update both previews and the stats once idle
             
             self.log_message(f"Successfully processed {len(df)} Books records.")
             messagebox.showinfo("Success", "Books data loaded successfully.")
@@ -756,6 +1220,189 @@ class GSTReconciliationApp:
             self.log_message(f"Error loading Books data: {str(e)}", error=True)
             messagebox.showerror("Error", f"Failed to load Books data: {str(e)}")
 
+    def _load_file_worker(self, file_path, source, custom_mapping):
+        """Reads and cleans a data file. Runs on a worker thread, so it must not touch Tk widgets."""
+        use_cache = self._cache_dir_ready()
+        cache_path = self._cache_path(file_path, source, custom_mapping)
+        if use_cache and os.path.exists(cache_path):
+            try:
+                df = pd.read_parquet(cache_path)
+                os.utime(cache_path) # Mark as recently used so pruning keeps it
+                self.log_message(f"Loaded {source} file with {len(df)} records from cache.")
+                return df
+            except Exception:
+                pass # Unreadable or stale cache entry; fall back to parsing the source file
+        
+        # Only columns the mapper can recognize are parsed; the rest are dropped by the reader
+        usecols = self._recognized_columns(source, custom_mapping)
+        
+        # Read file based on extension
+        if file_path.lower().endswith('.csv'):
+            df = self._read_csv(file_path, usecols)
+        else:
+            df = self._read_excel(file_path, usecols=usecols)
+        
+        self.log_message(f"Loaded {source} file with {len(df)} records.")
+        
+        # Clean and transform the loaded data
+        df = self.clean_and_transform_data(df, source, custom_mapping)
+        
+        if use_cache:
+            try:
+                # Keep the cleaned result (including match_key) so reloading the same file skips parsing
+                self._write_cache(cache_path, df)
+            except Exception:
+                pass # pyarrow is optional; caching is only an optimization
+        return df
+
+    def _recognized_columns(self, source, custom_mapping):
+        """Returns a usecols predicate matching headers that clean_and_transform_data can map."""
+        variations = [var for std_vars in STANDARD_COLUMNS_MAP.values() for var in std_vars]
+        if source == "Books":
+            variations += BOOK_ENTRY_DATE_VARIATIONS
+        wanted = {normalize_column_name(var) for var in variations}
+        wanted.update(normalize_column_name(col) for col in custom_mapping.values())
+        return lambda col: normalize_column_name(col) in wanted
+
+    def _file_identity(self, file_path):
+        """Returns (absolute path, mtime in ns, size) for a file; it changes whenever the file is edited."""
+        info = os.stat(file_path)
+        return os.path.abspath(file_path), info.st_mtime_ns, info.st_size
+
+    def _cache_path(self, file_path, source, custom_mapping):
+        """
+        Returns the Parquet cache file for a source file in IMPORT_CACHE_DIR. The name starts with a digest of
+        the file's path and source, followed by a digest of its version and the cleaning options.
+        """
+        abs_path, mtime_ns, size = self._file_identity(file_path)
+        source_key = repr((abs_path, source))
+        version_key = repr((mtime_ns, size, sorted(custom_mapping.items()), self.auto_clean_gstin))
+        source_digest = hashlib.sha1(source_key.encode('utf-8')).hexdigest()[:16]
+        version_digest = hashlib.sha1(version_key.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(IMPORT_CACHE_DIR, f"{source_digest}_{version_digest}.parquet")
+
+    def _cache_dir_ready(self):
+        """
+        Creates IMPORT_CACHE_DIR if needed and returns whether it is safe to use. The cache holds copies of
+        financial data, so on POSIX the folder must be a real directory owned by the current user, and
+        access for other accounts is removed.
+        """
+        try:
+            os.makedirs(IMPORT_CACHE_DIR, mode=0o700, exist_ok=True)
+            if os.name == 'posix':
+                info = os.lstat(IMPORT_CACHE_DIR)
+                if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+                    self.log_message(f"Import cache disabled: {IMPORT_CACHE_DIR} is not a folder owned by this user.", error=True)
+                    return False
+                if info.st_mode & 0o077:
+                    os.chmod(IMPORT_CACHE_DIR, 0o700) # makedirs' mode is reduced by the umask, and older folders may be open
+            return True
+        except OSError:
+            return False # The cache is only an optimization; import without it
+
+    def _write_cache(self, cache_path, df):
+        """
+        Stores a cleaned import in the cache, removing older entries for the same source file and
+        the least recently used entries beyond IMPORT_CACHE_MAX_FILES.
+        """
+        # Write to a temporary file in the same folder and move it into place in one step, so a
+        # concurrent load of the same file never sees (or interleaves with) a half-written entry
+        handle, temp_path = tempfile.mkstemp(suffix='.tmp', dir=IMPORT_CACHE_DIR)
+        os.close(handle)
+        try:
+            df.to_parquet(temp_path, compression='zstd')
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        
+        source_prefix = os.path.basename(cache_path).split('_')[0] + '_'
+        others = []
+        for entry in os.scandir(IMPORT_CACHE_DIR):
+            if not entry.name.endswith('.parquet') or entry.path == cache_path:
+                continue
+            try:
+                if entry.name.startswith(source_prefix):
+                    os.remove(entry.path) # Superseded: the file changed or was loaded with other options
+                else:
+                    others.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass # Removed concurrently by the other import worker
+        # The entry just written counts towards the limit
+        others.sort(reverse=True)
+        for _, path in others[IMPORT_CACHE_MAX_FILES - 1:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _read_csv(self, file_path, usecols=None):
+        """Reads a CSV file, preferring pyarrow's multi-threaded parser when it is installed."""
+        arrow_usecols = usecols
+        if callable(usecols):
+            # The pyarrow engine only takes a list for usecols, so resolve the predicate against the header
+            arrow_usecols = [col for col in pd.read_csv(file_path, nrows=0).columns if usecols(col)]
+        try:
+            return pd.read_csv(file_path, engine='pyarrow', usecols=arrow_usecols)
+        except ImportError:
+            pass # pyarrow is optional
+        except ValueError as e:
+            # pyarrow's stricter parser rejects some files the C engine accepts
+            self.log_message(f"Fast CSV parser failed on {os.path.basename(file_path)} ({e}); re-reading with the standard parser.")
+        return pd.read_csv(file_path, usecols=usecols)
+
+    def _read_excel(self, file_path, usecols=None):
+        """Reads an Excel file, preferring the Rust-backed calamine engine when it is installed."""
+        try:
+            return pd.read_excel(file_path, engine='calamine', usecols=usecols)
+        except (ImportError, ValueError):
+            # python-calamine is optional, pandas before 2.2 has no calamine engine, and workbooks
+            # calamine cannot parse may still open with openpyxl/xlrd
+            pass
+        
+        if not file_path.lower().endswith('.xlsx'):
+            return pd.read_excel(file_path, usecols=usecols) # Legacy .xls files are not supported by openpyxl
+        
+        chunks = list(self._stream_excel(file_path, usecols=usecols))
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=True)
+
+    def _stream_excel(self, file_path, chunk_size=50_000, usecols=None):
+        """
+        Yields the active sheet of an .xlsx file as DataFrames of at most chunk_size rows,
+        so only one chunk of raw row tuples is held in Python lists at a time.
+        usecols is an optional predicate on header names; other columns are never buffered.
+        """
+        # Open the workbook in read-only mode so openpyxl streams rows instead of
+        # loading every cell and style into memory
+        from openpyxl import load_workbook
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                yield pd.DataFrame()
+                return
+            columns = [str(col) if col is not None else f"Unnamed: {i}" for i, col in enumerate(header)]
+            keep = [i for i, col in enumerate(columns) if usecols is None or usecols(col)]
+            columns = [columns[i] for i in keep]
+            buffer = []
+            yielded = False
+            for row in rows:
+                # Skip fully blank rows, which read-only mode reports for formatted but empty cells
+                if all(value is None for value in row):
+                    continue
+                buffer.append(tuple(row[i] if i < len(row) else None for i in keep))
+                if len(buffer) == chunk_size:
+                    yield pd.DataFrame(buffer, columns=columns)
+                    buffer = []
+                    yielded = True
+            if buffer or not yielded:
+                yield pd.DataFrame(buffer, columns=columns)
+        finally:
+            wb.close() # Read-only workbooks keep the file handle open until closed
+
     def clean_and_transform_data(self, df, source, custom_mapping=None):
         """
         Cleans and transforms the input DataFrame to a standardized format.
@@ -773,63 +1420,40 @@ class GSTReconciliationApp:
             standard_columns.append('match_key')
             return pd.DataFrame(columns=standard_columns)
 
-        # Create a mapping of expected standard column names
         # Keys are standardized internal names, values are common variations
-        standard_columns_map = {
-            'invoice_no': ['invoice no', 'invoiceno', 'bill no', 'billno', 'invoice'],
-            'invoice_date': ['invoice date', 'invoicedate', 'bill date', 'billdate', 'date'],
-            'supplier_gstin': ['supplier gstin', 'suppliergstin', 'gstin', 'party gstin', 'receiver gstin'],
-            'taxable_value': ['taxable value', 'taxablevalue', 'value', 'net amount'],
-            'cgst': ['cgst', 'central tax'],
-            'sgst': ['sgst', 'state tax'],
-            'igst': ['igst', 'integrated tax'],
-            'total_amount': ['total amount', 'totalamount', 'amount', 'gross amount'],
-            'place_of_supply': ['place of supply', 'placeofsupply', 'pos']
-        }
+        standard_columns_map = {std_name: list(variations) for std_name, variations in STANDARD_COLUMNS_MAP.items()}
         
         if source == "Books":
-            standard_columns_map['book_entry_date'] = ['book entry date', 'bookentrydate', 'entry date', 'accounting date']
+            standard_columns_map['book_entry_date'] = list(BOOK_ENTRY_DATE_VARIATIONS)
 
-        # Normalize existing DataFrame columns for easier matching
-        original_cols = df.columns.tolist()
-        df.columns = df.columns.str.strip().str.lower().str.replace(r'[^a-z0-9]', '', regex=True)
-        normalized_df_cols = df.columns.tolist()
+        # Normalize existing DataFrame columns once for easier matching
+        df.columns = df.columns.str.strip().str.lower().str.translate(ALNUM_LOWER_TABLE)
+        normalized_df_cols = set(df.columns)
 
-        # Reverse the standard_columns_map for easy lookup from actual column names to standard names
+        # Reverse the standard_columns_map for easy lookup from normalized column names to standard names
         reverse_standard_map = {}
         for std_name, variations in standard_columns_map.items():
             for var in variations:
-                reverse_standard_map[var.replace(' ', '').lower()] = std_name
+                reverse_standard_map[normalize_column_name(var)] = std_name
 
-        # Apply custom mapping first
+        # Custom mapping takes precedence over the standard variations
+        custom_rename = {}
         if custom_mapping:
-            # Normalize custom mapping keys and values
-            normalized_custom_mapping = {}
             for std_key, user_col_display in custom_mapping.items():
-                normalized_user_col = user_col_display.strip().lower().replace(' ', '').replace(r'[^a-z0-9]', '', regex=True)
-                # Find the actual column name in the DataFrame's normalized columns
+                normalized_user_col = normalize_column_name(user_col_display)
                 if normalized_user_col in normalized_df_cols:
-                    # Get the original column name corresponding to the normalized one
-                    original_col_idx = normalized_df_cols.index(normalized_user_col)
-                    original_col_name = original_cols[original_col_idx]
-                    normalized_custom_mapping[original_col_name] = std_key
+                    custom_rename[normalized_user_col] = std_key
                 else:
                     self.log_message(f"Warning: Custom mapped column '{user_col_display}' for '{std_key}' not found in data. Skipping.", error=True)
 
-            # Rename columns based on custom mapping
-            df = df.rename(columns=normalized_custom_mapping)
-            # Re-normalize columns after custom renaming to ensure consistency for standard mapping
-            df.columns = df.columns.str.strip().str.lower().str.replace(r'[^a-z0-9]', '', regex=True)
-
-
-        # Now, map remaining columns to standard names
-        # Create a new dictionary for renaming to avoid modifying df.columns directly during iteration
+        # Map every column to its standard name in a single rename
+        # (unrecognized columns keep their normalized name; reconciliation only uses standard ones)
         rename_dict = {}
         for col in df.columns:
-            normalized_col_for_lookup = col.replace(' ', '').lower()
-            if normalized_col_for_lookup in reverse_standard_map:
-                rename_dict[col] = reverse_standard_map[normalized_col_for_lookup]
-            # else: keep original if no standard match, but for reconciliation, we only care about standard ones
+            if col in custom_rename:
+                rename_dict[col] = custom_rename[col]
+            elif col in reverse_standard_map:
+                rename_dict[col] = reverse_standard_map[col]
         df = df.rename(columns=rename_dict)
 
         # Ensure all standard columns exist, add with None if missing
@@ -843,23 +1467,32 @@ class GSTReconciliationApp:
             date_cols.append('book_entry_date')
             
         for col in date_cols:
+            if col in df.columns and pd.api.types.is_datetime64_any_dtype(df[col]):
+                continue # Excel-native dates arrive as datetime64 already; nothing to parse
             if col in df.columns:
                 # Convert to datetime, coercing errors to NaT (Not a Time)
-                # Try dayfirst=True for DD/MM/YYYY, then mixed for other common formats
-                df[col] = pd.to_datetime(df[col], errors='coerce', dayfirst=True)
-                # If still NaT for some, try with mixed format
-                df.loc[df[col].isna(), col] = pd.to_datetime(df.loc[df[col].isna(), col], errors='coerce', format='mixed')
+                # Fast fixed-format parse for the advertised DD/MM/YYYY layout, caching repeated dates
+                raw_dates = df[col]
+                parsed = pd.to_datetime(raw_dates, format='%d/%m/%Y', errors='coerce', cache=True)
+                # Only values that did not match fall back to the slower mixed-format parser
+                retry = parsed.isna() & raw_dates.notna()
+                if retry.any():
+                    parsed[retry] = pd.to_datetime(raw_dates[retry], errors='coerce', dayfirst=True, format='mixed')
+                df[col] = parsed
             else:
                 df[col] = pd.NaT # Ensure column exists and is NaT if no data
 
         # Convert numeric columns
         numeric_cols = ['taxable_value', 'cgst', 'sgst', 'igst', 'total_amount']
         for col in numeric_cols:
-            if col in df.columns:
+            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col]):
+                # Already numeric (the usual case for Excel imports): no string cleaning needed
+                df[col] = df[col].fillna(0.0).astype(float)
+            elif col in df.columns:
                 # Convert to string first to handle mixed types, then remove non-numeric chars
                 # and convert to numeric, filling NaNs with 0.0
                 df[col] = pd.to_numeric(
-                    df[col].astype(str).str.replace(r'[^\d.]', '', regex=True),
+                    df[col].astype(str).str.translate(NUMERIC_TABLE),
                     errors='coerce'
                 ).fillna(0.0).astype(float)
             else:
@@ -867,7 +1500,7 @@ class GSTReconciliationApp:
 
         # Clean GSTIN
         if 'supplier_gstin' in df.columns and self.auto_clean_gstin:
-            df['supplier_gstin'] = df['supplier_gstin'].apply(self.clean_gstin)
+            df['supplier_gstin'] = self._clean_gstin_series(df['supplier_gstin'])
         else:
             # Ensure 'supplier_gstin' column exists and is string type, fill NaN with empty string
             df['supplier_gstin'] = df.get('supplier_gstin', pd.Series(dtype=str)).fillna('').astype(str)
@@ -877,20 +1510,24 @@ class GSTReconciliationApp:
         df['invoice_no'] = df.get('invoice_no', pd.Series(dtype=str)).astype(str)
         df['supplier_gstin'] = df.get('supplier_gstin', pd.Series(dtype=str)).astype(str)
         
-        # Create match key. Handle cases where either might be missing or empty.
-        df['match_key'] = df['invoice_no'] + '_' + df['supplier_gstin']
-        # If invoice_no or supplier_gstin is empty/None/NaN, set match_key to NaN
-        df.loc[
-            (df['invoice_no'].isin(['', 'None', 'nan', None])) | 
-            (df['supplier_gstin'].isin(['', 'None', 'nan', None])), 
-            'match_key'
-        ] = np.nan
+        # Create match key. If invoice_no or supplier_gstin is empty/None/NaN, the key is NaN
+        missing_values = ['', 'None', 'nan']
+        key_missing = (df['invoice_no'].isna() | df['invoice_no'].isin(missing_values) |
+                       df['supplier_gstin'].isna() | df['supplier_gstin'].isin(missing_values))
+        df['match_key'] = df['invoice_no'].str.cat(df['supplier_gstin'], sep='_').mask(key_missing)
 
         # Fill missing place of supply
         if 'place_of_supply' in df.columns:
             df['place_of_supply'] = df['place_of_supply'].fillna('').astype(str)
         else:
             df['place_of_supply'] = '' # Ensure column exists
+        # Only a few dozen state codes and a bounded set of suppliers exist, so store them as small integer codes
+        df['place_of_supply'] = df['place_of_supply'].astype('category')
+        df['supplier_gstin'] = df['supplier_gstin'].astype('category')
+        # Keep the invoice numbers and join keys in contiguous Arrow buffers when pyarrow is available
+        if ARROW_STRING_DTYPE is not None:
+            df['invoice_no'] = df['invoice_no'].astype(ARROW_STRING_DTYPE)
+            df['match_key'] = df['match_key'].astype(ARROW_STRING_DTYPE)
 
         # Select and reorder only the standard columns for the output DataFrame
         # This ensures consistent schema for reconciliation
@@ -898,11 +1535,8 @@ class GSTReconciliationApp:
         if 'match_key' not in final_cols_order:
             final_cols_order.append('match_key')
         
-        # Filter df to only include columns that are in final_cols_order and actually exist in df
-        # Reindex to ensure the order
-        df = df[[col for col in final_cols_order if col in df.columns]].reindex(columns=final_cols_order)
-        
-        return df
+        # A single reindex selects, orders and (if needed) adds the standard columns
+        return df.reindex(columns=final_cols_order)
 
     def clean_gstin(self, gstin):
         """
@@ -916,7 +1550,7 @@ class GSTReconciliationApp:
         try:
             gstin = str(gstin).strip().upper()
             # Remove any character that is not an uppercase letter or a digit
-            gstin = re.sub(r'[^A-Z0-9]', '', gstin)
+            gstin = gstin.translate(ALNUM_UPPER_TABLE)
             
             # GSTINs are 15 characters long. Handle common issues.
             if len(gstin) > 15:
@@ -927,7 +1561,7 @@ class GSTReconciliationApp:
             
             # Basic validation: check if it's exactly 15 chars and starts with 2 digits (state code)
             # This is a basic check, full GSTIN validation is complex
-            if len(gstin) == 15 and gstin[:2].isdigit() and re.fullmatch(r'[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}', gstin):
+            if len(gstin) == 15 and gstin[:2].isdigit() and GSTIN_RE.fullmatch(gstin):
                  return gstin
             
             # If basic validation fails, return the cleaned string with a warning or a specific invalid marker
@@ -937,6 +1571,50 @@ class GSTReconciliationApp:
             self.log_message(f"Error cleaning GSTIN '{gstin}': {e}", error=True)
             return "" # Return empty string on error, safer than "INVALID_GSTIN" for matching
 
+    def _clean_gstin_series(self, gstins):
+        """
+        Vectorized equivalent of clean_gstin for a whole column of GSTINs.
+        Logs a single summary warning instead of one warning per invalid GSTIN.
+        """
+        gstins = gstins.astype('string').str.strip()
+        missing = gstins.isna() | gstins.str.lower().isin(['', 'nan', 'none'])
+        
+        # Keep only uppercase letters and digits, then truncate/pad to exactly 15 characters.
+        # What is left is plain ASCII, so a fixed-width |S15 array truncates on conversion
+        # and np.char.ljust pads every row in one C loop
+        kept = gstins.str.upper().str.translate(ALNUM_UPPER_TABLE).fillna('')
+        padded = np.char.ljust(kept.to_numpy(dtype='S15'), 15, b'X')
+        cleaned = pd.Series(padded.astype('U15'), index=gstins.index)
+        
+        invalid = ~missing.to_numpy() & ~self._validate_gstin_series(cleaned)
+        if invalid.any():
+            self.log_message(f"Warning: {int(invalid.sum())} GSTIN(s) appear to be invalid after cleaning "
+                             f"(e.g. '{cleaned[invalid].iloc[0]}').", error=False)
+        
+        return cleaned.mask(missing, "") # Empty string for NaN or empty inputs
+
+    def _validate_gstin_series(self, gstins):
+        """
+        Returns a boolean NumPy array marking which GSTINs match GSTIN_PATTERN.
+        Works on a (rows x 15) array of code points, so each position is checked with
+        array comparisons instead of running the regex engine once per row.
+        """
+        gstins = gstins.astype('string').fillna('')
+        right_length = gstins.str.len().to_numpy(dtype=int) == 15
+        # Fixed-width unicode array: shorter strings are NUL-padded, longer ones are cut off
+        codes = np.asarray(gstins.tolist(), dtype='U15').view(np.uint32).reshape(-1, 15)
+        
+        digit = (codes >= ord('0')) & (codes <= ord('9'))
+        letter = (codes >= ord('A')) & (codes <= ord('Z'))
+        return (right_length
+                & digit[:, 0:2].all(axis=1)      # State code
+                & letter[:, 2:7].all(axis=1)     # PAN: five letters,
+                & digit[:, 7:11].all(axis=1)     # four digits
+                & letter[:, 11]                  # and a letter
+                & (letter[:, 12] | ((codes[:, 12] >= ord('1')) & (codes[:, 12] <= ord('9')))) # Entity number
+                & (codes[:, 13] == ord('Z'))
+                & (letter[:, 14] | digit[:, 14])) # Checksum
+
     # --- MANUAL ENTRY METHODS ---
     def add_gstr2a_manual(self):
         """Adds a new manual GSTR-2A entry to the data."""
@@ -964,25 +1642,16 @@ class GSTReconciliationApp:
                 else:
                     entry_data[key] = "" # Ensure empty string for placeholders
 
-            # Create a DataFrame from the single entry
-            df = pd.DataFrame([entry_data])
-            
-            # Clean and transform the new entry
-            df = self.clean_and_transform_data(df, "GSTR-2A")
-            
-            # Check if the cleaned DataFrame is empty (e.g., if all critical fields were missing)
-            if df.empty or df.iloc[0].isnull().all(): # Check if the first row is all nulls
+            if not any(entry_data.values()):
                 messagebox.showerror("Error", "No valid data to add. Please fill in required fields.")
                 self.log_message("Attempted to add empty GSTR-2A manual entry.", error=True)
                 return
 
-            # Concatenate with existing GSTR-2A data
-            self.gstr2a_data = pd.concat([self.gstr2a_data, df], ignore_index=True)
-            
-            # Update UI elements for manual entries and stats
-            self.update_treeview(self.gstr2a_manual_tree, self.gstr2a_data)
-            self.update_treeview(self.gstr2a_tree, self.gstr2a_data) # Update main import tree too
-            self.update_gstr2a_stats()
+            # Clean the entry on its own and buffer it; pending entries become one DataFrame
+            # and are appended together the next time gstr2a_data is read
+            row = self._transform_one_row(entry_data, "GSTR-2A")
+            self._gstr2a_manual_rows.append(row)
+            self.schedule_ui_refresh('gstr2a')
             
             self.clear_gstr2a_form() # Clear the form after successful addition
             
@@ -1020,25 +1689,16 @@ class GSTReconciliationApp:
                 else:
                     entry_data[key] = "" # Ensure empty string for placeholders
             
-            # Create a DataFrame from the single entry
-            df = pd.DataFrame([entry_data])
-            
-            # Clean and transform the new entry
-            df = self.clean_and_transform_data(df, "Books")
-
-            # Check if the cleaned DataFrame is empty
-            if df.empty or df.iloc[0].isnull().all(): # Check if the first row is all nulls
+            if not any(entry_data.values()):
                 messagebox.showerror("Error", "No valid data to add. Please fill in required fields.")
                 self.log_message("Attempted to add empty Books manual entry.", error=True)
                 return
-            
-            # Concatenate with existing Books data
-            self.books_data = pd.concat([self.books_data, df], ignore_index=True)
-            
-            # Update UI elements for manual entries and stats
-            self.update_treeview(self.books_manual_tree, self.books_data)
-            self.update_treeview(self.books_tree, self.books_data) # Update main import tree too
-            self.update_books_stats()
+
+            # Clean the entry on its own and buffer it; pending entries become one DataFrame
+            # and are appended together the next time books_data is read
+            row = self._transform_one_row(entry_data, "Books")
+            self._books_manual_rows.append(row)
+            self.schedule_ui_refresh('books')
             
             self.clear_books_form() # Clear the form after successful addition
             
@@ -1093,30 +1753,19 @@ class GSTReconciliationApp:
             
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {len(selected_items)} selected entries?"):
             try:
-                # Collect match_keys of selected items for robust deletion
-                match_keys_to_delete = []
-                for item in selected_items:
-                    # Assuming 'Invoice No' and 'Supplier GSTIN' are sufficient to form the match_key
-                    # and are present in the Treeview's values in the correct order.
-                    # The `clean_and_transform_data` creates `match_key` as `invoice_no`_`supplier_gstin`.
-                    invoice_no = self.gstr2a_manual_tree.item(item, 'values')[0]
-                    supplier_gstin = self.gstr2a_manual_tree.item(item, 'values')[2] # Assuming GSTIN is the 3rd column (index 2)
-                    
-                    # Re-clean GSTIN to match how it's stored in the DataFrame's match_key
-                    cleaned_gstin = self.clean_gstin(supplier_gstin.replace('₹', '').strip()) # Remove currency symbol if present
-                    
-                    match_key = str(invoice_no).strip() + '_' + cleaned_gstin
-                    match_keys_to_delete.append(match_key)
+                # Item ids are positions in the tree's backing DataFrame, so the stored match_keys
+                # can be read directly instead of being rebuilt from the displayed values
+                selected_rows = self.gstr2a_manual_tree.df.iloc[[int(iid) for iid in selected_items]]
+                match_keys_to_delete = set(selected_rows['match_key'].dropna())
                 
                 prev_count = len(self.gstr2a_data)
-                # Filter out rows where 'match_key' is in the list of match_keys_to_delete
-                self.gstr2a_data = self.gstr2a_data[~self.gstr2a_data['match_key'].isin(match_keys_to_delete)].reset_index(drop=True)
+                # Drop every row sharing a selected match_key, plus the selected rows themselves (rows without a key)
+                to_delete = self.gstr2a_data['match_key'].isin(match_keys_to_delete) | self.gstr2a_data.index.isin(selected_rows.index)
+                self.gstr2a_data = self.gstr2a_data[~to_delete].reset_index(drop=True)
                 deleted_count = prev_count - len(self.gstr2a_data)
                 
                 if deleted_count > 0:
-                    self.update_treeview(self.gstr2a_manual_tree, self.gstr2a_data)
-                    self.update_treeview(self.gstr2a_tree, self.gstr2a_data) # Update main import tree
-                    self.update_gstr2a_stats()
+                    self.schedule_ui_refresh('gstr2a', full=True)
                     self.log_message(f"Deleted {deleted_count} GSTR-2A entries.")
                     messagebox.showinfo("Success", f"{deleted_count} entries deleted successfully.")
                 else:
@@ -1135,25 +1784,19 @@ class GSTReconciliationApp:
             
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {len(selected_items)} selected entries?"):
             try:
-                match_keys_to_delete = []
-                for item in selected_items:
-                    invoice_no = self.books_manual_tree.item(item, 'values')[0]
-                    supplier_gstin = self.books_manual_tree.item(item, 'values')[2] # Assuming GSTIN is the 3rd column (index 2)
-                    
-                    # Re-clean GSTIN to match how it's stored in the DataFrame's match_key
-                    cleaned_gstin = self.clean_gstin(supplier_gstin.replace('₹', '').strip())
-                    
-                    match_key = str(invoice_no).strip() + '_' + cleaned_gstin
-                    match_keys_to_delete.append(match_key)
+                # Item ids are positions in the tree's backing DataFrame, so the stored match_keys
+                # can be read directly instead of being rebuilt from the displayed values
+                selected_rows = self.books_manual_tree.df.iloc[[int(iid) for iid in selected_items]]
+                match_keys_to_delete = set(selected_rows['match_key'].dropna())
                 
                 prev_count = len(self.books_data)
-                self.books_data = self.books_data[~self.books_data['match_key'].isin(match_keys_to_delete)].reset_index(drop=True)
+                # Drop every row sharing a selected match_key, plus the selected rows themselves (rows without a key)
+                to_delete = self.books_data['match_key'].isin(match_keys_to_delete) | self.books_data.index.isin(selected_rows.index)
+                self.books_data = self.books_data[~to_delete].reset_index(drop=True)
                 deleted_count = prev_count - len(self.books_data)
                 
                 if deleted_count > 0:
-                    self.update_treeview(self.books_manual_tree, self.books_data)
-                    self.update_treeview(self.books_tree, self.books_data) # Update main import tree
-                    self.update_books_stats()
+                    self.schedule_ui_refresh('books', full=True)
                     self.log_message(f"Deleted {deleted_count} Books entries.")
                     messagebox.showinfo("Success", f"{deleted_count} entries deleted successfully.")
                 else:
@@ -1178,66 +1821,202 @@ class GSTReconciliationApp:
         self.clear_all_books()
 
     # --- DATA MANAGEMENT METHODS ---
+    @property
+    def gstr2a_data(self):
+        """All GSTR-2A rows, including imported chunks and manual entries not yet combined."""
+        if self._gstr2a_manual_rows:
+            self._gstr2a_chunks.append(self.clean_manual_rows(self._gstr2a_manual_rows, "GSTR-2A"))
+        if self._gstr2a_chunks:
+            self._gstr2a_data = self.combine_data(self._gstr2a_data, *self._gstr2a_chunks)
+            self._gstr2a_chunks.clear()
+            self._data_versions['gstr2a'] += 1
+        return self._gstr2a_data
+
+    @gstr2a_data.setter
+    def gstr2a_data(self, df):
+        # Assigning replaces everything, including anything still pending
+        self._gstr2a_chunks.clear()
+        self._gstr2a_manual_rows.clear()
+        self._gstr2a_data = df
+        self._data_versions['gstr2a'] += 1
+        if df.empty:
+            self._gstr2a_files.clear() # Everything was cleared, so any file may be imported afresh
+
+    @property
+    def books_data(self):
+        """All Books rows, including imported chunks and manual entries not yet combined."""
+        if self._books_manual_rows:
+            self._books_chunks.append(self.clean_manual_rows(self._books_manual_rows, "Books"))
+        if self._books_chunks:
+            self._books_data = self.combine_data(self._books_data, *self._books_chunks)
+            self._books_chunks.clear()
+            self._data_versions['books'] += 1
+        return self._books_data
+
+    @books_data.setter
+    def books_data(self, df):
+        # Assigning replaces everything, including anything still pending
+        self._books_chunks.clear()
+        self._books_manual_rows.clear()
+        self._books_data = df
+        self._data_versions['books'] += 1
+        if df.empty:
+            self._books_files.clear() # Everything was cleared, so any file may be imported afresh
+
+    def clean_manual_rows(self, pending, source):
+        """Builds a cleaned DataFrame from buffered manual entries (already transformed) and empties the buffer."""
+        columns = list(STANDARD_COLUMNS_MAP)
+        if source == "Books":
+            columns.append('book_entry_date')
+        columns.append('match_key')
+        
+        df = pd.DataFrame.from_records(pending, columns=columns)
+        pending.clear()
+        
+        # Give the columns the same dtypes clean_and_transform_data produces, so combining stays cheap
+        for col in ('invoice_date', 'book_entry_date'):
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col])
+        for col in ('taxable_value', 'cgst', 'sgst', 'igst', 'total_amount'):
+            df[col] = df[col].astype(float)
+        df['invoice_no'] = df['invoice_no'].astype(ARROW_STRING_DTYPE or str)
+        df['match_key'] = df['match_key'].astype(df['invoice_no'].dtype)
+        df['place_of_supply'] = df['place_of_supply'].astype(str).astype('category')
+        df['supplier_gstin'] = df['supplier_gstin'].astype(str).astype('category')
+        return df
+
+    def _transform_one_row(self, entry, source):
+        """
+        Scalar counterpart of clean_and_transform_data for a single manual entry, whose keys
+        are already the standard column names. Avoids building a DataFrame per entry.
+        """
+        row = {}
+        row['invoice_no'] = str(entry.get('invoice_no', ''))
+        
+        date_cols = ['invoice_date']
+        if source == "Books":
+            date_cols.append('book_entry_date')
+        for col in date_cols:
+            row[col] = self._parse_date(entry.get(col, ''))
+        
+        for col in ('taxable_value', 'cgst', 'sgst', 'igst', 'total_amount'):
+            try:
+                row[col] = float(str(entry.get(col, '')).translate(NUMERIC_TABLE))
+            except ValueError:
+                row[col] = 0.0 # Empty or unparseable amounts count as zero
+        
+        gstin = entry.get('supplier_gstin', '')
+        row['supplier_gstin'] = self.clean_gstin(gstin) if self.auto_clean_gstin else str(gstin)
+        row['place_of_supply'] = str(entry.get('place_of_supply', ''))
+        
+        # Same rule as the vectorized path: no key when either part is missing
+        missing_values = ('', 'None', 'nan')
+        if row['invoice_no'] in missing_values or row['supplier_gstin'] in missing_values:
+            row['match_key'] = None
+        else:
+            row['match_key'] = row['invoice_no'] + '_' + row['supplier_gstin']
+        return row
+
+    def _parse_date(self, value):
+        """Parses one DD/MM/YYYY date (falling back to flexible day-first parsing); NaT if unparseable."""
+        value = str(value).strip()
+        if not value:
+            return pd.NaT
+        try:
+            return pd.Timestamp(datetime.strptime(value, '%d/%m/%Y'))
+        except ValueError:
+            return pd.to_datetime(value, errors='coerce', dayfirst=True)
+
+    def schedule_ui_refresh(self, source, full=False):
+        """
+        Marks the previews and stats of source ('gstr2a' or 'books') as stale and refreshes them
+        once Tk is idle, so clustered imports, manual adds and deletes repaint only once.
+        """
+        if full or self._ui_dirty[source] == 'full':
+            self._ui_dirty[source] = 'full' # Rows were removed: rebuild the previews
+        else:
+            self._ui_dirty[source] = 'append' # Rows were only appended: extend the previews
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self.root.after_idle(self._flush_ui)
+
+    def _flush_ui(self):
+        self._ui_flush_scheduled = False
+        for source, mode in self._ui_dirty.items():
+            if mode is None:
+                continue
+            self._ui_dirty[source] = None
+            try:
+                if source == 'gstr2a':
+                    trees, data, update_stats = (self.gstr2a_tree, self.gstr2a_manual_tree), self.gstr2a_data, self.update_gstr2a_stats
+                else:
+                    trees, data, update_stats = (self.books_tree, self.books_manual_tree), self.books_data, self.update_books_stats
+                refresh = self.update_treeview if mode == 'full' else self.append_to_treeview
+                for tree in trees:
+                    refresh(tree, data)
+                update_stats()
+            except Exception as e:
+                self.log_message(f"Error refreshing {source} data views: {str(e)}", error=True)
+
+    def combine_data(self, existing, *new):
+        """Appends newly cleaned frames to an existing dataset with a single concat, keeping column dtypes intact."""
+        # Concatenating with an empty frame would upcast every column to object dtype
+        frames = [df for df in (existing, *new) if not df.empty]
+        if not frames:
+            return existing
+        if len(frames) == 1:
+            return frames[0].reset_index(drop=True)
+        
+        # Categorical columns only stay categorical through concat if every frame has identical
+        # categories, so widen them all to the union first
+        for col in frames[0].columns:
+            if all(col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype) for df in frames):
+                categories = union_categoricals([df[col] for df in frames], sort_categories=True).categories
+                frames = [df.assign(**{col: df[col].cat.set_categories(categories)}) for df in frames]
+        return pd.concat(frames, ignore_index=True)
+
     def update_treeview(self, tree, df):
         """
         Updates a given Treeview widget with data from a DataFrame.
-        Formats dates and numbers for display.
+        Only the rows in the visible viewport are rendered; formatting is applied on demand.
         """
-        # Clear existing data in the treeview
-        for item in tree.get_children():
-            tree.delete(item)
-        
-        if df.empty:
-            return
+        # Resolve the internal column names once per tree, not on every render;
+        # unknown display names default to lowercase_underscore
+        internal_columns = [DISPLAY_TO_INTERNAL_COLUMNS.get(col, col.lower().replace(' ', '_')) for col in tree['columns']]
+        tree.set_dataframe(df, formatter=lambda part: self.format_tree_rows(internal_columns, part))
 
-        # Get the columns expected by the treeview (display names)
-        tree_columns_display = tree['columns']
-        
-        # Map display names to internal DataFrame column names
-        # This mapping should be consistent with `clean_and_transform_data`
-        display_to_internal_map = {
-            "Invoice No": "invoice_no",
-            "Invoice Date": "invoice_date",
-            "Supplier GSTIN": "supplier_gstin",
-            "Taxable Value": "taxable_value",
-            "CGST": "cgst",
-            "SGST": "sgst",
-            "IGST": "igst",
-            "Total Amount": "total_amount",
-            "Place of Supply": "place_of_supply",
-            "Book Entry Date": "book_entry_date", # Only for books
-            "Source": "source", # For reconciliation results
-            "Issue Type": "issue_type", # For reconciliation results
-            "GSTR-2A Date": "gstr_2a_date", # For reconciliation results (internal name might differ)
-            "Books Date": "books_date", # For reconciliation results (internal name might differ)
-            "GSTR-2A GSTIN": "gstr_2a_gstin", # For reconciliation results
-            "Books GSTIN": "books_gstin", # For reconciliation results
-            "Amount Diff": "amount_diff", # For reconciliation results
-            "Tax Diff": "tax_diff", # For reconciliation results
-            "Details": "details" # For reconciliation results
-        }
+    def append_to_treeview(self, tree, df):
+        """
+        Refreshes a Treeview after rows were appended to its DataFrame (imports and manual adds).
+        Existing rows keep their items and scroll position; deletes and clears use update_treeview.
+        """
+        if tree.formatter is None:
+            self.update_treeview(tree, df)
+        else:
+            tree.extend_dataframe(df)
 
-        # Insert new data row by row
-        for _, row in df.iterrows():
-            values = []
-            for col_display_name in tree_columns_display:
-                # Get the internal column name from the map, default to lowercase_underscore
-                col_internal_name = display_to_internal_map.get(col_display_name, col_display_name.lower().replace(' ', '_'))
-                
-                if col_internal_name in row and pd.notna(row[col_internal_name]):
-                    value = row[col_internal_name]
-                    # Format dates
-                    if 'date' in col_internal_name and isinstance(value, pd.Timestamp):
-                        value = value.strftime('%d/%m/%Y')
-                    # Format numbers (currency)
-                    elif isinstance(value, (int, float)):
-                        value = f"₹{value:,.2f}"
-                    else:
-                        value = str(value)
-                    values.append(value)
-                else:
-                    values.append("") # Append empty string if column not found or value is NaN
-            tree.insert("", "end", values=values)
+    def format_tree_rows(self, internal_columns, df):
+        """
+        Formats a slice of a DataFrame into Treeview row values.
+        Formats dates and numbers for display; internal_columns are the DataFrame
+        column names behind the tree's display columns, in display order.
+        """
+        # Format the slice column by column, then zip the columns into row values
+        columns = []
+        for col_internal_name in internal_columns:
+            if col_internal_name not in df.columns:
+                columns.append([""] * len(df)) # Empty strings if the column is not found
+                continue
+            
+            values = df[col_internal_name]
+            if 'date' in col_internal_name and pd.api.types.is_datetime64_any_dtype(values):
+                formatted = format_ddmmyyyy(values) # Format dates
+            elif pd.api.types.is_float_dtype(values):
+                formatted = values.map('₹{:,.2f}'.format) # Format numbers (currency)
+            else:
+                formatted = values.astype(object).astype(str)
+            columns.append(formatted.where(values.notna(), "").tolist()) # Empty strings for NaN values
+        return [list(row) for row in zip(*columns)]
 
     def update_gstr2a_stats(self):
         """Updates the statistics displayed for GSTR-2A data."""
@@ -1245,11 +2024,11 @@ class GSTReconciliationApp:
             self.gstr2a_stats.set("Records: 0 | Total Value: ₹0 | Total Tax: ₹0")
             return
             
-        total_value = self.gstr2a_data['taxable_value'].sum() if 'taxable_value' in self.gstr2a_data.columns else 0
-        total_tax = 0
-        if 'cgst' in self.gstr2a_data.columns: total_tax += self.gstr2a_data['cgst'].sum()
-        if 'sgst' in self.gstr2a_data.columns: total_tax += self.gstr2a_data['sgst'].sum()
-        if 'igst' in self.gstr2a_data.columns: total_tax += self.gstr2a_data['igst'].sum()
+        # Sum the value and tax columns in a single aggregation
+        data = self.gstr2a_data
+        sums = data[[col for col in ('taxable_value', 'cgst', 'sgst', 'igst') if col in data.columns]].sum(numeric_only=True)
+        total_value = sums.get('taxable_value', 0)
+        total_tax = sums.get('cgst', 0) + sums.get('sgst', 0) + sums.get('igst', 0)
 
         self.gstr2a_stats.set(f"Records: {len(self.gstr2a_data)} | Total Value: ₹{total_value:,.2f} | Total Tax: ₹{total_tax:,.2f}")
 
@@ -1259,38 +2038,27 @@ class GSTReconciliationApp:
             self.books_stats.set("Records: 0 | Total Value: ₹0 | Total Tax: ₹0")
             return
             
-        total_value = self.books_data['taxable_value'].sum() if 'taxable_value' in self.books_data.columns else 0
-        total_tax = 0
-        if 'cgst' in self.books_data.columns: total_tax += self.books_data['cgst'].sum()
-        if 'sgst' in self.books_data.columns: total_tax += self.books_data['sgst'].sum()
-        if 'igst' in self.books_data.columns: total_tax += self.books_data['igst'].sum()
+        # Sum the value and tax columns in a single aggregation
+        data = self.books_data
+        sums = data[[col for col in ('taxable_value', 'cgst', 'sgst', 'igst') if col in data.columns]].sum(numeric_only=True)
+        total_value = sums.get('taxable_value', 0)
+        total_tax = sums.get('cgst', 0) + sums.get('sgst', 0) + sums.get('igst', 0)
 
         self.books_stats.set(f"Records: {len(self.books_data)} | Total Value: ₹{total_value:,.2f} | Total Tax: ₹{total_tax:,.2f}")
 
     def clear_gstr2a_import(self):
         """Clears only the imported GSTR-2A data (resets the DataFrame and UI)."""
         if messagebox.askyesno("Confirm", "Clear all imported GSTR-2A data? This will clear all GSTR-2A data, including manual entries."):
-            self.gstr2a_data = pd.DataFrame(columns=[
-                'invoice_no', 'invoice_date', 'supplier_gstin', 'taxable_value', 
-                'cgst', 'sgst', 'igst', 'total_amount', 'place_of_supply', 'match_key'
-            ])
-            self.update_treeview(self.gstr2a_tree, self.gstr2a_data)
-            self.update_treeview(self.gstr2a_manual_tree, self.gstr2a_data) # Clear manual tree too
-            self.update_gstr2a_stats()
+            self.gstr2a_data = self._empty_gstr2a.copy()
+            self.schedule_ui_refresh('gstr2a', full=True)
             self.log_message("Cleared all GSTR-2A data.")
             messagebox.showinfo("Cleared", "All GSTR-2A data has been cleared.")
 
     def clear_books_import(self):
         """Clears only the imported Books data (resets the DataFrame and UI)."""
         if messagebox.askyesno("Confirm", "Clear all imported Books data? This will clear all Books data, including manual entries."):
-            self.books_data = pd.DataFrame(columns=[
-                'invoice_no', 'invoice_date', 'supplier_gstin', 'taxable_value', 
-                'cgst', 'sgst', 'igst', 'total_amount', 'place_of_supply', 
-                'book_entry_date', 'match_key'
-            ])
-            self.update_treeview(self.books_tree, self.books_data)
-            self.update_treeview(self.books_manual_tree, self.books_data) # Clear manual tree too
-            self.update_books_stats()
+            self.books_data = self._empty_books.copy()
+            self.schedule_ui_refresh('books', full=True)
             self.log_message("Cleared all Books data.")
             messagebox.showinfo("Cleared", "All Books data has been cleared.")
 
@@ -1305,7 +2073,14 @@ class GSTReconciliationApp:
     # --- RECONCILIATION METHODS ---
     def run_reconciliation(self):
         """Initiates the reconciliation process."""
-        if self.gstr2a_data.empty or self.books_data.empty:
+        if 'reconciliation' in self._running:
+            messagebox.showinfo("Info", "A reconciliation is already running. Please wait for it to finish.")
+            return
+        
+        # Snapshot both datasets here on the main thread: the data properties combine pending imports
+        # and manual rows when read, so the background worker must only ever see these frames
+        gstr2a_data, books_data = self.gstr2a_data, self.books_data
+        if gstr2a_data.empty or books_data.empty:
             messagebox.showerror("Error", "Both GSTR-2A and Books data must be loaded before reconciliation.")
             self.log_message("Reconciliation aborted: Data missing.", error=True)
             return
@@ -1321,8 +2096,8 @@ class GSTReconciliationApp:
                              'taxable_value', 'cgst', 'sgst', 'igst', 'total_amount', 'match_key']
             
             # Check if essential columns are present after cleaning
-            gstr2a_missing_cols = [col for col in required_cols if col not in self.gstr2a_data.columns]
-            books_missing_cols = [col for col in required_cols if col not in self.books_data.columns]
+            gstr2a_missing_cols = [col for col in required_cols if col not in gstr2a_data.columns]
+            books_missing_cols = [col for col in required_cols if col not in books_data.columns]
 
             if gstr2a_missing_cols:
                 messagebox.showerror("Error", f"Required columns missing in GSTR-2A data: {', '.join(gstr2a_missing_cols)}. Please check your data and mapping.")
@@ -1336,8 +2111,22 @@ class GSTReconciliationApp:
                 self.log_message(f"Reconciliation failed: Missing required columns in Books: {books_missing_cols}", error=True)
                 return
 
-            # Perform the core reconciliation logic
-            results = self.perform_reconciliation()
+            # Perform the core reconciliation logic off the Tk main loop; one run at a time, so
+            # results can never be overwritten by an earlier run finishing late
+            self.run_recon_button.config(state=tk.DISABLED)
+            self.run_in_background('reconciliation', self.perform_reconciliation, self._apply_reconciliation,
+                                   gstr2a_data, books_data)
+            
+        except Exception as e:
+            self.recon_status.set("Error")
+            self.log_message(f"Reconciliation error: {str(e)}", error=True)
+            messagebox.showerror("Error", f"Reconciliation failed: {str(e)}")
+
+    def _apply_reconciliation(self, future):
+        """Displays finished reconciliation results (runs on the main thread)."""
+        self.run_recon_button.config(state=tk.NORMAL)
+        try:
+            results = future.result()
             self.reconciliation_results = results
             
             # Update UI with reconciliation results
@@ -1355,226 +2144,275 @@ class GSTReconciliationApp:
             self.log_message(f"Reconciliation error: {str(e)}", error=True)
             messagebox.showerror("Error", f"Reconciliation failed: {str(e)}")
 
-    def perform_reconciliation(self):
+    def perform_reconciliation(self, gstr2a_data, books_data):
         """
-        Performs the core reconciliation logic between GSTR-2A and Books data.
+        Performs the core reconciliation logic between the given GSTR-2A and Books data.
         Identifies missing invoices, mismatches in date, amount, tax, and GSTIN,
         and detects duplicates.
+        Every category is built as a whole-column DataFrame and the categories are stacked once.
         """
-        results = []
-        
         # Ensure 'match_key' is present and drop rows where it's NaN for reconciliation
         # Use .copy() to avoid SettingWithCopyWarning
-        gstr_data_filtered = self.gstr2a_data.dropna(subset=['match_key']).copy()
-        books_data_filtered = self.books_data.dropna(subset=['match_key']).copy()
-
-        # Identify duplicates within each dataset
-        # Keep all occurrences of duplicates to report them
-        gstr_duplicates = gstr_data_filtered[gstr_data_filtered.duplicated(subset=['match_key'], keep=False)]
-        if not gstr_duplicates.empty:
-            for _, row in gstr_duplicates.iterrows():
-                results.append({
-                    "Invoice No": row.get('invoice_no', ''),
-                    "Source": "GSTR-2A",
-                    "Issue Type": "Duplicate in GSTR-2A",
-                    "GSTR-2A Date": row.get('invoice_date', pd.NaT),
-                    "Books Date": pd.NaT,
-                    "GSTR-2A GSTIN": row.get('supplier_gstin', ''),
-                    "Books GSTIN": '',
-                    "Amount Diff": 0.0,
-                    "Tax Diff": 0.0,
-                    "Details": "Duplicate invoice found in GSTR-2A data."
-                })
-
-        books_duplicates = books_data_filtered[books_data_filtered.duplicated(subset=['match_key'], keep=False)]
-        if not books_duplicates.empty:
-            for _, row in books_duplicates.iterrows():
-                results.append({
-                    "Invoice No": row.get('invoice_no', ''),
-                    "Source": "Books",
-                    "Issue Type": "Duplicate in Books",
-                    "GSTR-2A Date": pd.NaT,
-                    "Books Date": row.get('invoice_date', pd.NaT),
-                    "GSTR-2A GSTIN": '',
-                    "Books GSTIN": row.get('supplier_gstin', ''),
-                    "Amount Diff": 0.0,
-                    "Tax Diff": 0.0,
-                    "Details": "Duplicate invoice found in Books data."
-                })
+        gstr_data_filtered = gstr2a_data.dropna(subset=['match_key']).copy()
+        books_data_filtered = books_data.dropna(subset=['match_key']).copy()
+
+        # Identify duplicates within each dataset with one hash pass per direction:
+        # a row is a repeat if an earlier or a later row shares its match_key
+        gstr_repeat = gstr_data_filtered.duplicated(subset=['match_key'], keep='first')
+        gstr_has_later = gstr_data_filtered.duplicated(subset=['match_key'], keep='last')
+        books_repeat = books_data_filtered.duplicated(subset=['match_key'], keep='first')
+        books_has_later = books_data_filtered.duplicated(subset=['match_key'], keep='last')
+        
+        # Keep all occurrences of duplicates to report them, grouped by supplier and invoice
+        gstr_duplicates = gstr_data_filtered[gstr_repeat | gstr_has_later].sort_values(
+            ['supplier_gstin', 'invoice_no'], kind='stable')
+        duplicates_in_gstr2a = pd.DataFrame({
+            "Invoice No": gstr_duplicates['invoice_no'].to_numpy(),
+            "Source": "GSTR-2A",
+            "Issue Type": "Duplicate in GSTR-2A",
+            "GSTR-2A Date": gstr_duplicates['invoice_date'].to_numpy(),
+            "Books Date": pd.NaT,
+            "GSTR-2A GSTIN": gstr_duplicates['supplier_gstin'].to_numpy(),
+            "Books GSTIN": '',
+            "Amount Diff": 0.0,
+            "Tax Diff": 0.0,
+            "Details": "Duplicate invoice found in GSTR-2A data."
+        })
+
+        books_duplicates = books_data_filtered[books_repeat | books_has_later].sort_values(
+            ['supplier_gstin', 'invoice_no'], kind='stable')
+        duplicates_in_books = pd.DataFrame({
+            "Invoice No": books_duplicates['invoice_no'].to_numpy(),
+            "Source": "Books",
+            "Issue Type": "Duplicate in Books",
+            "GSTR-2A Date": pd.NaT,
+            "Books Date": books_duplicates['invoice_date'].to_numpy(),
+            "GSTR-2A GSTIN": '',
+            "Books GSTIN": books_duplicates['supplier_gstin'].to_numpy(),
+            "Amount Diff": 0.0,
+            "Tax Diff": 0.0,
+            "Details": "Duplicate invoice found in Books data."
+        })
 
         # Remove duplicates from filtered dataframes for core matching logic
-        # Keep 'first' occurrence of the match_key
-        gstr_data_unique = gstr_data_filtered.drop_duplicates(subset=['match_key'], keep='first')
-        books_data_unique = books_data_filtered.drop_duplicates(subset=['match_key'], keep='first')
-
-        # Create sets of unique match keys for efficient lookup
-        gstr_keys = set(gstr_data_unique['match_key'])
-        books_keys = set(books_data_unique['match_key'])
-        
-        # Find missing in books (present in GSTR-2A but not in Books)
-        missing_in_books_keys = gstr_keys - books_keys
-        for key in missing_in_books_keys:
-            row = gstr_data_unique[gstr_data_unique['match_key'] == key].iloc[0]
-            results.append({
-                "Invoice No": row.get('invoice_no', ''),
-                "Source": "GSTR-2A",
-                "Issue Type": "Missing in Books",
-                "GSTR-2A Date": row.get('invoice_date', pd.NaT),
-                "Books Date": pd.NaT, # Explicitly NaT for missing
-                "GSTR-2A GSTIN": row.get('supplier_gstin', ''),
-                "Books GSTIN": '', # Explicitly empty for missing
-                "Amount Diff": row.get('total_amount', 0.0),
-                "Tax Diff": (row.get('cgst', 0.0) + row.get('sgst', 0.0) + row.get('igst', 0.0)),
-                "Details": "Invoice found in GSTR-2A but not in Books."
-            })
-        
-        # Find missing in GSTR-2A (present in Books but not in GSTR-2A)
-        missing_in_gstr2a_keys = books_keys - gstr_keys
-        for key in missing_in_gstr2a_keys:
-            row = books_data_unique[books_data_unique['match_key'] == key].iloc[0]
-            results.append({
-                "Invoice No": row.get('invoice_no', ''),
-                "Source": "Books",
-                "Issue Type": "Missing in GSTR-2A",
-                "GSTR-2A Date": pd.NaT, # Explicitly NaT for missing
-                "Books Date": row.get('invoice_date', pd.NaT),
-                "GSTR-2A GSTIN": '', # Explicitly empty for missing
-                "Books GSTIN": row.get('supplier_gstin', ''),
-                "Amount Diff": -row.get('total_amount', 0.0), # Negative indicates missing from GSTR-2A perspective
-                "Tax Diff": -(row.get('cgst', 0.0) + row.get('sgst', 0.0) + row.get('igst', 0.0)),
-                "Details": "Invoice found in Books but not in GSTR-2A."
-            })
-        
-        # Find matching invoices and check for mismatches
-        common_keys = gstr_keys & books_keys
-        for key in common_keys:
-            gstr_row = gstr_data_unique[gstr_data_unique['match_key'] == key].iloc[0]
-            book_row = books_data_unique[books_data_unique['match_key'] == key].iloc[0]
-            
-            issues = []
-            
-            # Date comparison
-            gstr_date = gstr_row.get('invoice_date')
-            book_date = book_row.get('invoice_date')
-            
-            if pd.notna(gstr_date) and pd.notna(book_date):
-                try:
-                    # Ensure both are datetime objects for comparison
-                    gstr_date_dt = pd.to_datetime(gstr_date, errors='coerce')
-                    book_date_dt = pd.to_datetime(book_date, errors='coerce')
-
-                    if pd.notna(gstr_date_dt) and pd.notna(book_date_dt):
-                        date_diff = (gstr_date_dt - book_date_dt).days
-                        if abs(date_diff) > self.date_tolerance:
-                            issues.append(f"Date diff: {abs(date_diff)} days")
-                    else:
-                        issues.append("Date format error in one or both records") # If conversion failed for one or both
-                except Exception as e:
-                    issues.append(f"Date comparison error: {e}")
-            elif pd.notna(gstr_date) != pd.notna(book_date): # One date is missing, the other is present
-                issues.append("One invoice date missing")
-            
-            # GSTIN comparison
-            gstr_gstin = str(gstr_row.get('supplier_gstin', '')).strip().upper()
-            book_gstin = str(book_row.get('supplier_gstin', '')).strip().upper()
-            if gstr_gstin != book_gstin:
-                issues.append("GSTIN mismatch")
-            
-            # Amount comparison
-            gstr_total = gstr_row.get('total_amount', 0.0)
-            book_total = book_row.get('total_amount', 0.0)
-            amount_diff = gstr_total - book_total
-            if abs(amount_diff) > self.amount_tolerance:
-                issues.append(f"Amount diff: ₹{amount_diff:.2f}")
-            
-            # Tax comparison
-            gstr_tax = (gstr_row.get('cgst', 0.0) + gstr_row.get('sgst', 0.0) + gstr_row.get('igst', 0.0))
-            book_tax = (book_row.get('cgst', 0.0) + book_row.get('sgst', 0.0) + book_row.get('igst', 0.0))
-            tax_diff = gstr_tax - book_tax
-            if abs(tax_diff) > self.amount_tolerance:
-                issues.append(f"Tax diff: ₹{tax_diff:.2f}")
-            
-            # If any issues found, add to results
-            if issues:
-                result = {
-                    "Invoice No": gstr_row.get('invoice_no', ''), # Use GSTR-2A invoice no as primary
-                    "Source": "Both",
-                    "Issue Type": ", ".join(issues),
-                    "GSTR-2A Date": gstr_date,
-                    "Books Date": book_date,
-                    "GSTR-2A GSTIN": gstr_gstin,
-                    "Books GSTIN": book_gstin,
-                    "Amount Diff": amount_diff,
-                    "Tax Diff": tax_diff,
-                    "Details": "; ".join(issues)
-                }
-                results.append(result)
-        
-        # Convert list of dicts to DataFrame
-        return pd.DataFrame(results)
+        # Keep 'first' occurrence of the match_key, reusing the mask computed above
+        gstr_data_unique = gstr_data_filtered[~gstr_repeat]
+        books_data_unique = books_data_filtered[~books_repeat]
+
+        # Hash-join both sides on match_key in a single pass instead of looking up each key
+        merged = gstr_data_unique.merge(books_data_unique, on='match_key', how='outer',
+                                        suffixes=('_2a', '_bk'), indicator=True)
+        in_gstr2a_only = (merged['_merge'] == 'left_only').to_numpy()
+        in_books_only = (merged['_merge'] == 'right_only').to_numpy()
+        in_both = (merged['_merge'] == 'both').to_numpy()
+        
+        # Compute all differences for matched pairs as whole-column operations
+        gstr_tax = (merged['cgst_2a'] + merged['sgst_2a'] + merged['igst_2a']).to_numpy(dtype=float)
+        book_tax = (merged['cgst_bk'] + merged['sgst_bk'] + merged['igst_bk']).to_numpy(dtype=float)
+        amount_diff = (merged['total_amount_2a'] - merged['total_amount_bk']).to_numpy(dtype=float)
+        tax_diff = gstr_tax - book_tax
+        
+        gstr_dates = pd.to_datetime(merged['invoice_date_2a'], errors='coerce')
+        book_dates = pd.to_datetime(merged['invoice_date_bk'], errors='coerce')
+        date_diff = (gstr_dates - book_dates).dt.days.abs().to_numpy(dtype=float) # NaN if either date is missing
+        
+        # GSTINs are categorical: normalize only the (few) categories of each side, map both onto
+        # one shared set of codes and compare integer codes instead of per-row strings
+        gstr_gstin_raw = merged['supplier_gstin_2a'].astype('category').cat
+        book_gstin_raw = merged['supplier_gstin_bk'].astype('category').cat
+        gstr_gstin_names = gstr_gstin_raw.categories.astype(str).str.strip().str.upper().to_numpy()
+        book_gstin_names = book_gstin_raw.categories.astype(str).str.strip().str.upper().to_numpy()
+        shared_codes, _ = pd.factorize(np.concatenate([gstr_gstin_names, book_gstin_names]))
+        # Row codes of -1 (missing GSTIN) pick the trailing -1 appended to each lookup table
+        gstr_gstins = np.append(shared_codes[:len(gstr_gstin_names)], -1)[gstr_gstin_raw.codes.to_numpy()]
+        book_gstins = np.append(shared_codes[len(gstr_gstin_names):], -1)[book_gstin_raw.codes.to_numpy()]
+        
+        # Tolerance checks for every matched pair at once (comparisons with NaN are False)
+        date_mismatch = in_both & (date_diff > self.date_tolerance)
+        one_date_missing = in_both & (gstr_dates.isna() != book_dates.isna()).to_numpy()
+        gstin_mismatch = in_both & (gstr_gstins != book_gstins)
+        amount_mismatch = in_both & (np.abs(amount_diff) > self.amount_tolerance)
+        tax_mismatch = in_both & (np.abs(tax_diff) > self.amount_tolerance)
+        
+        # Suggest likely counterparts for unmatched invoices from the same supplier
+        gstr_only = merged[in_gstr2a_only]
+        books_only = merged[in_books_only]
+        gstr_suggestions, books_suggestions = self.suggest_invoice_matches(gstr_only, books_only)
+        
+        # Missing in books (present in GSTR-2A but not in Books), built as whole columns
+        gstr_suggestions = np.asarray(gstr_suggestions, dtype=object)
+        missing_in_books = pd.DataFrame({
+            "Invoice No": gstr_only['invoice_no_2a'].to_numpy(),
+            "Source": "GSTR-2A",
+            "Issue Type": "Missing in Books",
+            "GSTR-2A Date": gstr_only['invoice_date_2a'].to_numpy(),
+            "Books Date": pd.NaT, # Explicitly NaT for missing
+            "GSTR-2A GSTIN": gstr_only['supplier_gstin_2a'].to_numpy(),
+            "Books GSTIN": '', # Explicitly empty for missing
+            "Amount Diff": gstr_only['total_amount_2a'].to_numpy(dtype=float),
+            "Tax Diff": gstr_tax[in_gstr2a_only],
+            "Details": np.where(gstr_suggestions != '',
+                                "Invoice found in GSTR-2A but not in Books. Possible match in Books: " + gstr_suggestions + ".",
+                                "Invoice found in GSTR-2A but not in Books.")
+        })
+        
+        # Missing in GSTR-2A (present in Books but not in GSTR-2A)
+        books_suggestions = np.asarray(books_suggestions, dtype=object)
+        missing_in_gstr2a = pd.DataFrame({
+            "Invoice No": books_only['invoice_no_bk'].to_numpy(),
+            "Source": "Books",
+            "Issue Type": "Missing in GSTR-2A",
+            "GSTR-2A Date": pd.NaT, # Explicitly NaT for missing
+            "Books Date": books_only['invoice_date_bk'].to_numpy(),
+            "GSTR-2A GSTIN": '', # Explicitly empty for missing
+            "Books GSTIN": books_only['supplier_gstin_bk'].to_numpy(),
+            "Amount Diff": -books_only['total_amount_bk'].to_numpy(dtype=float), # Negative indicates missing from GSTR-2A perspective
+            "Tax Diff": -book_tax[in_books_only],
+            "Details": np.where(books_suggestions != '',
+                                "Invoice found in Books but not in GSTR-2A. Possible match in GSTR-2A: " + books_suggestions + ".",
+                                "Invoice found in Books but not in GSTR-2A.")
+        })
+        
+        # Report matched invoices that failed at least one check. Each failed check contributes
+        # "<text>, " to the issue string, and the trailing separator is cut off at the end
+        has_issue = np.flatnonzero(date_mismatch | one_date_missing | gstin_mismatch | amount_mismatch | tax_mismatch)
+        issue_parts = [
+            (date_mismatch, np.char.add(np.char.add("Date diff: ", np.nan_to_num(date_diff[has_issue]).astype(int).astype(str)), " days")),
+            (one_date_missing, "One invoice date missing"),
+            (gstin_mismatch, "GSTIN mismatch"),
+            (amount_mismatch, np.char.add("Amount diff: ₹", np.char.mod('%.2f', amount_diff[has_issue]))),
+            (tax_mismatch, np.char.add("Tax diff: ₹", np.char.mod('%.2f', tax_diff[has_issue]))),
+        ]
+        issues = pd.Series('', index=has_issue, dtype=object)
+        for failed, text in issue_parts:
+            issues += np.where(failed[has_issue], np.char.add(text, ", "), "")
+        issues = issues.str[:-2]
+        
+        mismatches = pd.DataFrame({
+            "Invoice No": merged['invoice_no_2a'].to_numpy()[has_issue], # Use GSTR-2A invoice no as primary
+            "Source": "Both",
+            "Issue Type": issues.to_numpy(),
+            "GSTR-2A Date": merged['invoice_date_2a'].to_numpy()[has_issue],
+            "Books Date": merged['invoice_date_bk'].to_numpy()[has_issue],
+            "GSTR-2A GSTIN": gstr_gstin_names[gstr_gstin_raw.codes.to_numpy()[has_issue]], # Both sides exist for matched pairs
+            "Books GSTIN": book_gstin_names[book_gstin_raw.codes.to_numpy()[has_issue]],
+            "Amount Diff": amount_diff[has_issue],
+            "Tax Diff": tax_diff[has_issue],
+            "Details": issues.str.replace(", ", "; ", regex=False).to_numpy()
+        })
+        
+        # Stack duplicates, missing invoices and mismatches into one frame
+        frames = [df for df in (duplicates_in_gstr2a, duplicates_in_books, missing_in_books, missing_in_gstr2a, mismatches)
+                  if not df.empty]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def suggest_invoice_matches(self, gstr_only, books_only):
+        """
+        Pairs unmatched invoices from the same supplier whose invoice numbers are nearly identical
+        (e.g. 'INV-2023-001' vs 'INV/2023/1'). Returns, for each side, the best candidate invoice
+        number from the other side or an empty string. Requires the optional rapidfuzz package.
+        """
+        gstr_suggestions = [''] * len(gstr_only)
+        books_suggestions = [''] * len(books_only)
+        if fuzz_process is None or gstr_only.empty or books_only.empty:
+            return gstr_suggestions, books_suggestions
+        
+        # Compare invoice numbers without case, separators or zero padding ('INV/2023/001' -> 'INV20231')
+        gstr_invoices = gstr_only['invoice_no_2a'].astype(str)
+        books_invoices = books_only['invoice_no_bk'].astype(str)
+        normalize = lambda invoices: (invoices.str.upper()
+                                      .str.replace(INVOICE_ZERO_PAD_RE, '', regex=True)
+                                      .str.translate(ALNUM_UPPER_TABLE))
+        gstr_norm = normalize(gstr_invoices)
+        books_norm = normalize(books_invoices)
+        
+        # Only compare invoices from the same supplier carrying the same digits, so 'INV-3' is never
+        # paired with 'INV-4' and each pairwise matrix stays small
+        gstr_keys = [gstr_only['supplier_gstin_2a'].astype(str), gstr_norm.str.translate(DIGITS_TABLE)]
+        books_keys = [books_only['supplier_gstin_bk'].astype(str), books_norm.str.translate(DIGITS_TABLE)]
+        gstr_norm, books_norm = gstr_norm.tolist(), books_norm.tolist()
+        books_buckets = books_only.groupby(books_keys).indices
+        for bucket, gstr_pos in gstr_only.groupby(gstr_keys).indices.items():
+            books_pos = books_buckets.get(bucket)
+            if books_pos is None:
+                continue
+            scores = fuzz_process.cdist([gstr_norm[i] for i in gstr_pos], [books_norm[j] for j in books_pos],
+                                        scorer=JaroWinkler.normalized_similarity, score_cutoff=0.88, workers=-1)
+            # Scores below the cutoff are reported as 0
+            for i, j in enumerate(scores.argmax(axis=1)):
+                if scores[i, j] > 0:
+                    gstr_suggestions[gstr_pos[i]] = books_invoices.iat[books_pos[j]]
+            for j, i in enumerate(scores.argmax(axis=0)):
+                if scores[i, j] > 0:
+                    books_suggestions[books_pos[j]] = gstr_invoices.iat[gstr_pos[i]]
+        
+        return gstr_suggestions, books_suggestions
 
     def update_results_ui(self, results):
         """
         Updates the Treeviews in the Reconciliation tab with the reconciliation results.
         Populates different tabs based on discrepancy types.
         """
-        # Clear all existing data in all discrepancy trees
-        for tree in self.discrepancy_trees.values():
-            for item in tree.get_children():
-                tree.delete(item)
-        
         if results.empty:
+            # Clear all existing data in all discrepancy trees
+            for tree in self.discrepancy_trees.values():
+                tree.set_dataframe(results, formatter=self.format_result_rows, tagger=self.result_row_tags)
             self.log_message("No discrepancies found during reconciliation.")
             return
         
-        # Populate each treeview based on issue type
-        for _, row in results.iterrows():
-            # Ensure all values are properly formatted strings for Treeview insertion
-            gstr2a_date_str = row['GSTR-2A Date'].strftime('%d/%m/%Y') if pd.notna(row['GSTR-2A Date']) else ''
-            books_date_str = row['Books Date'].strftime('%d/%m/%Y') if pd.notna(row['Books Date']) else ''
-
-            values = [
-                str(row.get("Invoice No", "")),
-                str(row.get("Source", "")),
-                str(row.get("Issue Type", "")),
-                gstr2a_date_str,
-                books_date_str,
-                str(row.get("GSTR-2A GSTIN", "")),
-                str(row.get("Books GSTIN", "")),
-                f"₹{row.get('Amount Diff', 0.0):,.2f}",
-                f"₹{row.get('Tax Diff', 0.0):,.2f}",
-                str(row.get("Details", ""))
-            ]
-            
-            # Add to the 'All Discrepancies' tab
-            self.discrepancy_trees['all'].insert("", "end", values=values)
-            
-            # Add to specific tabs based on issue type
-            issue_type_lower = row.get('Issue Type', '').lower()
-            
-            if "missing in books" in issue_type_lower:
-                self.discrepancy_trees['missing_in_books'].insert("", "end", values=values)
-            elif "missing in gstr2a" in issue_type_lower:
-                self.discrepancy_trees['missing_in_gstr2a'].insert("", "end", values=values)
-            # Check for "date" and "mismatch" as separate words to avoid partial matches
-            elif "date" in issue_type_lower and "mismatch" in issue_type_lower:
-                self.discrepancy_trees['date_mismatch'].insert("", "end", values=values)
-            elif ("amount" in issue_type_lower or "tax" in issue_type_lower) and "mismatch" in issue_type_lower:
-                self.discrepancy_trees['amount_mismatch'].insert("", "end", values=values)
-            elif "gstin mismatch" in issue_type_lower:
-                self.discrepancy_trees['gstin_mismatch'].insert("", "end", values=values)
-            elif "duplicate" in issue_type_lower:
-                self.discrepancy_trees['duplicates'].insert("", "end", values=values)
+        # One boolean mask per specific tab, each a single substring scan over the issue types.
+        # Matched invoices can fail several checks at once, so a row may appear in several tabs
+        issue_types = results['Issue Type'].fillna('').astype(str).str.lower()
+        contains = lambda text: issue_types.str.contains(text, regex=False).to_numpy(dtype=bool)
+        tab_masks = {
+            'missing_in_books': contains("missing in books"),
+            'missing_in_gstr2a': contains("missing in gstr-2a"),
+            'date_mismatch': contains("date diff") | contains("date missing"),
+            'amount_mismatch': contains("amount diff") | contains("tax diff"),
+            'gstin_mismatch': contains("gstin mismatch"),
+            'duplicates': contains("duplicate"),
+        }
+        
+        # Hand each treeview its slice of the results; rows are rendered lazily as they scroll into view
+        for key, tree in self.discrepancy_trees.items():
+            tab_results = results if key == 'all' else results[tab_masks[key]]
+            tree.set_dataframe(tab_results, formatter=self.format_result_rows, tagger=self.result_row_tags)
+
+    def format_result_rows(self, results):
+        """Formats a slice of the reconciliation results into Treeview row values."""
+        # Format column by column, then zip the columns into row tuples in one go
+        as_text = lambda col: results[col].astype(object).astype(str)
+        as_date = lambda col: format_ddmmyyyy(pd.to_datetime(results[col]))
+        as_money = lambda col: results[col].map('₹{:,.2f}'.format)
+        columns = [
+            as_text("Invoice No"),
+            as_text("Source"),
+            as_text("Issue Type"),
+            as_date("GSTR-2A Date"),
+            as_date("Books Date"),
+            as_text("GSTR-2A GSTIN"),
+            as_text("Books GSTIN"),
+            as_money("Amount Diff"),
+            as_money("Tax Diff"),
+            as_text("Details")
+        ]
+        return list(zip(*(col.tolist() for col in columns)))
+
+    def result_row_tags(self, results):
+        """Returns the colour tag for each row of a slice of the reconciliation results."""
+        issue_types = results['Issue Type'].fillna('').astype(str).str.lower()
+        conditions = [
+            issue_types.str.contains("duplicate", regex=False).to_numpy(dtype=bool),
+            issue_types.str.contains("missing in", regex=False).to_numpy(dtype=bool),
+        ]
+        tags = np.select(conditions, ['duplicate', 'missing'], default='mismatch')
+        return [(tag,) for tag in tags.tolist()]
 
     # --- INSIGHTS AND REPORTING ---
     def generate_insights(self, results):
         """
         Generates visualizations and a summary report based on reconciliation results.
         """
-        # Clear previous plots from all subplots
-        for ax in self.axs.flatten():
-            ax.clear()
-        
         # Prepare and update the summary text
         summary = self.get_summary_text(results)
         self.summary_text.config(state=tk.NORMAL)
@@ -1582,23 +2420,25 @@ class GSTReconciliationApp:
         self.summary_text.insert(tk.END, summary)
         self.summary_text.config(state=tk.DISABLED)
         
-        # Generate and draw visualizations
-        self.generate_visualizations_charts(results) # Renamed to avoid confusion with overall method
-        self.canvas.draw() # Redraw the matplotlib canvas
+        # Generate and draw visualizations; panels whose data did not change are left as they are
+        if self.generate_visualizations_charts(results): # Renamed to avoid confusion with overall method
+            self.canvas.draw_idle() # Redraw the matplotlib canvas once Tk is idle
 
     def get_summary_text(self, results):
         """Generates a detailed text summary of the reconciliation results."""
         total_discrepancies = len(results)
         
-        # Count specific issue types
-        # Use .str.contains for more robust matching of issue types that might be combined
-        missing_in_books = results[results['Issue Type'].str.contains('Missing in Books', case=False, na=False)].shape[0] if not results.empty else 0
-        missing_in_gstr2a = results[results['Issue Type'].str.contains('Missing in GSTR-2A', case=False, na=False)].shape[0] if not results.empty else 0
+        # Count specific issue types with plain substring scans over the issue types, lowercased once.
+        # Substring matching also counts issue types that were combined into one string
+        issue_types = results['Issue Type'].fillna('').astype(str).str.lower() if not results.empty else pd.Series(dtype=str)
+        contains = lambda text: issue_types.str.contains(text, regex=False)
+        missing_in_books = int(contains('missing in books').sum())
+        missing_in_gstr2a = int(contains('missing in gstr-2a').sum())
         
-        date_mismatch = results[results['Issue Type'].str.contains('Date diff', case=False, na=False)].shape[0] if not results.empty else 0
-        amount_tax_mismatch = results[results['Issue Type'].str.contains('Amount diff|Tax diff', case=False, na=False)].shape[0] if not results.empty else 0
-        gstin_mismatch = results[results['Issue Type'].str.contains('GSTIN mismatch', case=False, na=False)].shape[0] if not results.empty else 0
-        duplicates = results[results['Issue Type'].str.contains('Duplicate', case=False, na=False)].shape[0] if not results.empty else 0
+        date_mismatch = int(contains('date diff').sum())
+        amount_tax_mismatch = int((contains('amount diff') | contains('tax diff')).sum())
+        gstin_mismatch = int(contains('gstin mismatch').sum())
+        duplicates = int(contains('duplicate').sum())
         
         total_amount_diff = results['Amount Diff'].sum() if 'Amount Diff' in results.columns and not results.empty else 0.0
         total_tax_diff = results['Tax Diff'].sum() if 'Tax Diff' in results.columns and not results.empty else 0.0
@@ -1635,31 +2475,53 @@ Recommended Action Items:
         return summary
 
     def generate_visualizations_charts(self, results):
-        """Generates various charts to visualize reconciliation insights."""
+        """
+        Generates various charts to visualize reconciliation insights.
+        Only panels whose underlying data changed are cleared and re-plotted, drawing straight
+        onto the axes from NumPy arrays; returns True if any panel was redrawn.
+        """
+        has_issue_types = not results.empty and 'Issue Type' in results.columns
+        if has_issue_types:
+            # Primary issue of each row (the first of combined issues), extracted once for both charts
+            primary_issue = results['Issue Type'].fillna('Unknown').astype(str).str.split(',', n=1).str[0].str.strip()
+        redrawn = False
+        
         # Discrepancy type distribution (Top-Left)
         ax1 = self.axs[0, 0]
-        if not results.empty and 'Issue Type' in results.columns:
-            # Count occurrences of each primary issue type
-            # Use a more robust way to extract primary issue type, handling combined strings
-            issue_counts = results['Issue Type'].apply(lambda x: x.split(',')[0].strip() if isinstance(x, str) else 'Unknown').value_counts().head(10)
+        # Count occurrences of each primary issue type
+        issue_counts = primary_issue.value_counts().head(10) if has_issue_types else pd.Series(dtype=int)
+        if self._chart_changed('issue_counts', issue_counts):
+            redrawn = True
+            ax1.clear()
             if not issue_counts.empty:
-                issue_counts.plot(kind='bar', ax=ax1, color='skyblue')
+                positions = np.arange(len(issue_counts))
+                ax1.bar(positions, issue_counts.to_numpy(), color='skyblue')
+                ax1.set_xticks(positions, labels=issue_counts.index.tolist())
+                ax1.set_xlabel('Issue Type')
                 ax1.set_title('Top Discrepancy Types')
                 ax1.set_ylabel('Count')
                 ax1.tick_params(axis='x', rotation=45, labelsize=8)
                 ax1.grid(axis='y', linestyle='--', alpha=0.7)
             else:
                 ax1.text(0.5, 0.5, 'No discrepancy data', ha='center', va='center', transform=ax1.transAxes)
-        else:
-            ax1.text(0.5, 0.5, 'No discrepancy data', ha='center', va='center', transform=ax1.transAxes)
         
         # Financial impact by issue type (Top-Right)
         ax2 = self.axs[0, 1]
-        if not results.empty and 'Issue Type' in results.columns and 'Amount Diff' in results.columns and 'Tax Diff' in results.columns:
+        if has_issue_types and 'Amount Diff' in results.columns and 'Tax Diff' in results.columns:
             # Group by primary issue type and sum absolute differences
-            financial_impact = results.groupby(results['Issue Type'].apply(lambda x: x.split(',')[0].strip() if isinstance(x, str) else 'Unknown'))[['Amount Diff', 'Tax Diff']].sum().abs()
+            financial_impact = results.groupby(primary_issue)[['Amount Diff', 'Tax Diff']].sum().abs()
+        else:
+            financial_impact = pd.DataFrame()
+        if self._chart_changed('financial_impact', financial_impact):
+            redrawn = True
+            ax2.clear()
             if not financial_impact.empty:
-                financial_impact.plot(kind='bar', ax=ax2, stacked=True, color=['lightcoral', 'lightgreen'])
+                positions = np.arange(len(financial_impact))
+                amounts = financial_impact['Amount Diff'].to_numpy()
+                ax2.bar(positions, amounts, color='lightcoral')
+                ax2.bar(positions, financial_impact['Tax Diff'].to_numpy(), bottom=amounts, color='lightgreen') # Stacked on top
+                ax2.set_xticks(positions, labels=financial_impact.index.tolist())
+                ax2.set_xlabel('Issue Type')
                 ax2.set_title('Financial Impact by Issue Type')
                 ax2.set_ylabel('Absolute Amount (₹)')
                 ax2.tick_params(axis='x', rotation=45, labelsize=8)
@@ -1667,35 +2529,41 @@ Recommended Action Items:
                 ax2.grid(axis='y', linestyle='--', alpha=0.7)
             else:
                 ax2.text(0.5, 0.5, 'No financial impact data', ha='center', va='center', transform=ax2.transAxes)
-        else:
-            ax2.text(0.5, 0.5, 'No financial impact data', ha='center', va='center', transform=ax2.transAxes)
         
         # Monthly discrepancy trend (Bottom-Left)
         ax3 = self.axs[1, 0]
+        monthly_trend = None
         if not results.empty and 'GSTR-2A Date' in results.columns:
             try:
-                # Ensure 'GSTR-2A Date' is datetime and filter out NaT values before resampling
-                valid_dates_results = results[pd.notna(results['GSTR-2A Date'])].copy()
-                valid_dates_results['GSTR-2A Date'] = pd.to_datetime(valid_dates_results['GSTR-2A Date'])
-
-                if not valid_dates_results.empty:
-                    monthly_trend = valid_dates_results.set_index('GSTR-2A Date').resample('M').size()
-                    if not monthly_trend.empty:
-                        monthly_trend.plot(kind='line', ax=ax3, marker='o', color='purple')
-                        ax3.set_title('Monthly Discrepancy Trend (GSTR-2A Date)')
-                        ax3.set_ylabel('Count')
-                        ax3.set_xlabel('Month')
-                        ax3.grid(True)
-                        ax3.tick_params(axis='x', rotation=45, labelsize=8)
-                    else:
-                        ax3.text(0.5, 0.5, 'No monthly trend data', ha='center', va='center', transform=ax3.transAxes)
+                # Count discrepancies per calendar month straight from the date column, skipping NaT values
+                valid_dates = pd.to_datetime(results['GSTR-2A Date'], errors='coerce').dropna()
+                if not valid_dates.empty:
+                    monthly_counts = valid_dates.dt.to_period('M').value_counts()
+                    # Months without discrepancies are plotted as zero
+                    monthly_trend = monthly_counts.reindex(
+                        pd.period_range(monthly_counts.index.min(), monthly_counts.index.max(), freq='M'), fill_value=0)
+                    trend_state = monthly_trend
                 else:
-                    ax3.text(0.5, 0.5, 'No valid date data for trend', ha='center', va='center', transform=ax3.transAxes)
+                    trend_state = 'No valid date data for trend'
             except Exception as e:
-                ax3.text(0.5, 0.5, f'Error generating trend: {e}', ha='center', va='center', transform=ax3.transAxes)
+                trend_state = f'Error generating trend: {e}'
                 self.log_message(f"Error generating monthly trend chart: {e}", error=True)
         else:
-            ax3.text(0.5, 0.5, 'Date data unavailable or invalid', ha='center', va='center', transform=ax3.transAxes)
+            trend_state = 'Date data unavailable or invalid'
+        if self._chart_changed('monthly_trend', trend_state):
+            redrawn = True
+            ax3.clear()
+            if monthly_trend is not None:
+                positions = np.arange(len(monthly_trend))
+                ax3.plot(positions, monthly_trend.to_numpy(), marker='o', color='purple')
+                ax3.set_xticks(positions, labels=monthly_trend.index.strftime('%b %Y').tolist())
+                ax3.set_title('Monthly Discrepancy Trend (GSTR-2A Date)')
+                ax3.set_ylabel('Count')
+                ax3.set_xlabel('Month')
+                ax3.grid(True)
+                ax3.tick_params(axis='x', rotation=45, labelsize=8)
+            else:
+                ax3.text(0.5, 0.5, trend_state, ha='center', va='center', transform=ax3.transAxes)
         
         # Top vendors with issues (Bottom-Right)
         ax4 = self.axs[1, 1]
@@ -1703,8 +2571,15 @@ Recommended Action Items:
             # Filter out empty/invalid GSTINs before counting
             valid_gstins = results[results['GSTR-2A GSTIN'].astype(str).str.strip() != '']['GSTR-2A GSTIN']
             top_vendors = valid_gstins.value_counts().head(10)
+        else:
+            top_vendors = pd.Series(dtype=int)
+        if self._chart_changed('top_vendors', top_vendors):
+            redrawn = True
+            ax4.clear()
             if not top_vendors.empty:
-                top_vendors.plot(kind='bar', ax=ax4, color='salmon')
+                positions = np.arange(len(top_vendors))
+                ax4.bar(positions, top_vendors.to_numpy(), color='salmon')
+                ax4.set_xticks(positions, labels=top_vendors.index.astype(str).tolist())
                 ax4.set_title('Top 10 Vendors with Discrepancies')
                 ax4.set_ylabel('Count')
                 ax4.set_xlabel('Supplier GSTIN')
@@ -1712,12 +2587,33 @@ Recommended Action Items:
                 ax4.grid(axis='y', linestyle='--', alpha=0.7)
             else:
                 ax4.text(0.5, 0.5, 'No vendor data', ha='center', va='center', transform=ax4.transAxes)
-        else:
-            ax4.text(0.5, 0.5, 'No vendor data', ha='center', va='center', transform=ax4.transAxes)
         
-        self.fig.tight_layout(pad=5.0) # Re-adjust layout after plotting
+        return redrawn
+
+    def _chart_changed(self, panel, data):
+        """
+        Records what a chart panel is about to show (a Series/DataFrame of plotted values or a
+        placeholder message) and returns False if the panel already shows exactly that.
+        """
+        if isinstance(data, (pd.Series, pd.DataFrame)):
+            signature = (data.index.tolist(), data.to_numpy().tolist())
+        else:
+            signature = data
+        if panel in self._chart_signatures and self._chart_signatures[panel] == signature:
+            return False
+        self._chart_signatures[panel] = signature
+        return True
 
     # --- EXPORT METHODS ---
+    def _recon_export_frame(self, results):
+        """
+        Returns the reconciliation results prepared for Excel export: amounts rounded to 2 decimal places.
+        Excel shows native dates and amounts through the number formats of _write_excel_sheets.
+        """
+        # Only the rounded columns are rebuilt; assign shares every other column with the results
+        amount_cols = results.columns.intersection(['Amount Diff', 'Tax Diff'])
+        return results.assign(**{col: results[col].round(2) for col in amount_cols})
+
     def export_results(self):
         """Exports the reconciliation results to an Excel or CSV file."""
         if self.reconciliation_results is None or self.reconciliation_results.empty:
@@ -1726,7 +2622,7 @@ Recommended Action Items:
         
         file_path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
-            filetypes=[("Excel Files", "*.xlsx"), ("CSV Files", "*.csv"), ("All Files", "*.*")],
+            filetypes=[("Excel Files", "*.xlsx"), ("CSV Files", "*.csv"), ("Parquet Files", "*.parquet"), ("All Files", "*.*")],
             title="Save Reconciliation Report"
         )
         
@@ -1734,30 +2630,23 @@ Recommended Action Items:
             return # User cancelled the save dialog
         
         try:
-            # Create a copy to format dates and amounts for export
-            export_df = self.reconciliation_results.copy()
-            
-            # Format date columns to string for export
-            for col in ['GSTR-2A Date', 'Books Date']:
-                if col in export_df.columns:
-                    export_df[col] = export_df[col].dt.strftime('%d/%m/%Y').fillna('')
+            if file_path.lower().endswith('.parquet'):
+                # Columnar binary export keeps native dates and amounts; no per-cell formatting needed
+                self.reconciliation_results.to_parquet(file_path, compression='zstd', index=False)
+                self.log_message(f"Exported results to: {file_path}")
+                messagebox.showinfo("Success", f"Reconciliation results exported to:\n{file_path}")
+                return
             
-            # Format numeric columns to 2 decimal places
-            for col in ['Amount Diff', 'Tax Diff']:
-                if col in export_df.columns:
-                    export_df[col] = export_df[col].apply(lambda x: f"{x:.2f}")
-
             if file_path.lower().endswith('.csv'):
-                export_df.to_csv(file_path, index=False)
+                # pandas' CSV writer formats dates as dd/mm/yyyy and amounts to 2 decimal places itself
+                self.reconciliation_results.to_csv(file_path, index=False, date_format='%d/%m/%Y', float_format='%.2f')
             else:
-                with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                    export_df.to_excel(writer, sheet_name='Discrepancies', index=False)
-                    
-                    # Add summary sheet
-                    summary = self.get_summary_text(self.reconciliation_results)
-                    # Create a DataFrame for the summary text. Ensure it's in a format pandas can write.
-                    summary_df = pd.DataFrame([{"Reconciliation Summary": summary}])
-                    summary_df.to_excel(writer, sheet_name='Summary', index=False, header=True)
+                export_df = self._recon_export_frame(self.reconciliation_results)
+                # Add summary sheet: a header cell and the summary text, written without a DataFrame
+                summary = self.get_summary_text(self.reconciliation_results)
+                summary_rows = [("Reconciliation Summary",), (summary,)]
+                # Both sheets are written in one pass, top to bottom
+                self._write_excel_sheets(file_path, {'Discrepancies': export_df, 'Summary': summary_rows})
             
             self.log_message(f"Exported results to: {file_path}")
             messagebox.showinfo("Success", f"Reconciliation results exported to:\n{file_path}")
@@ -1778,39 +2667,23 @@ Recommended Action Items:
             return # User cancelled
         
         try:
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                if not self.gstr2a_data.empty:
-                    # Create a copy to format dates for export
-                    gstr2a_export_df = self.gstr2a_data.copy()
-                    if 'invoice_date' in gstr2a_export_df.columns:
-                        gstr2a_export_df['invoice_date'] = gstr2a_export_df['invoice_date'].dt.strftime('%d/%m/%Y').fillna('')
-                    gstr2a_export_df.to_excel(writer, sheet_name='GSTR-2A Data', index=False)
-                else:
-                    self.log_message("No GSTR-2A data to export.", error=False)
-                    
-                if not self.books_data.empty:
-                    # Create a copy to format dates for export
-                    books_export_df = self.books_data.copy()
-                    if 'invoice_date' in books_export_df.columns:
-                        books_export_df['invoice_date'] = books_export_df['invoice_date'].dt.strftime('%d/%m/%Y').fillna('')
-                    if 'book_entry_date' in books_export_df.columns:
-                        books_export_df['book_entry_date'] = books_export_df['book_entry_date'].dt.strftime('%d/%m/%Y').fillna('')
-                    books_export_df.to_excel(writer, sheet_name='Books Data', index=False)
-                else:
-                    self.log_message("No Books data to export.", error=False)
-
-                if self.reconciliation_results is not None and not self.reconciliation_results.empty:
-                    # Create a copy to format dates and amounts for export
-                    recon_export_df = self.reconciliation_results.copy()
-                    for col in ['GSTR-2A Date', 'Books Date']:
-                        if col in recon_export_df.columns:
-                            recon_export_df[col] = recon_export_df[col].dt.strftime('%d/%m/%Y').fillna('')
-                    for col in ['Amount Diff', 'Tax Diff']:
-                        if col in recon_export_df.columns:
-                            recon_export_df[col] = recon_export_df[col].apply(lambda x: f"{x:.2f}")
-                    recon_export_df.to_excel(writer, sheet_name='Reconciliation Results', index=False)
-                else:
-                    self.log_message("No reconciliation results to export.", error=False)
+            sheets = {} # Sheet name -> DataFrame, written together once everything is prepared
+            if not self.gstr2a_data.empty:
+                sheets['GSTR-2A Data'] = self.gstr2a_data # Dates are written natively as dd/mm/yyyy
+            else:
+                self.log_message("No GSTR-2A data to export.", error=False)
+                
+            if not self.books_data.empty:
+                sheets['Books Data'] = self.books_data
+            else:
+                self.log_message("No Books data to export.", error=False)
+
+            if self.reconciliation_results is not None and not self.reconciliation_results.empty:
+                sheets['Reconciliation Results'] = self._recon_export_frame(self.reconciliation_results)
+            else:
+                self.log_message("No reconciliation results to export.", error=False)
+            
+            self._write_excel_sheets(file_path, sheets)
             
             self.log_message(f"Exported all available data to: {file_path}")
             messagebox.showinfo("Success", f"All available data exported to:\n{file_path}")
@@ -1825,9 +2698,10 @@ Recommended Action Items:
         try:
             # Validate and convert date tolerance
             date_tol_str = self.date_tol_var.get()
-            if not date_tol_str.isdigit():
+            try:
+                self.date_tolerance = max(0, int(date_tol_str.strip()))
+            except ValueError:
                 raise ValueError("Date tolerance must be a whole number.")
-            self.date_tolerance = max(0, int(date_tol_str))
 
             # Validate and convert amount tolerance
             amount_tol_str = self.amount_tol_var.get()
@@ -1848,106 +2722,156 @@ Recommended Action Items:
             self.log_message(f"An unexpected error occurred while saving settings: {str(e)}", error=True)
             messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
 
-    def show_data_summary(self):
-        """Displays a summary of the loaded GSTR-2A and Books data in a new dialog."""
-        summary = "=== Data Summary ===\n\n"
-        
-        # GSTR-2A summary
-        summary += "GSTR-2A Data:\n"
-        if self.gstr2a_data.empty:
-            summary += "  No data loaded\n"
-        else:
-            summary += f"  Records: {len(self.gstr2a_data)}\n"
-            # Ensure 'invoice_date' exists and is datetime type before min/max
-            if 'invoice_date' in self.gstr2a_data.columns and pd.api.types.is_datetime64_any_dtype(self.gstr2a_data['invoice_date']):
-                valid_dates = self.gstr2a_data['invoice_date'].dropna()
-                if not valid_dates.empty:
-                    min_date = valid_dates.min()
-                    max_date = valid_dates.max()
-                    summary += f"  Period: {min_date.strftime('%d/%m/%Y')} to {max_date.strftime('%d/%m/%Y')}\n"
-                else:
-                    summary += "  Period: N/A (No valid dates)\n"
+    def _data_summary_lines(self, data):
+        """Returns the data summary lines for one cleaned dataset, reading each numeric column in a single pass."""
+        if data.empty:
+            return ["  No data loaded\n"]
+        lines = [f"  Records: {len(data)}\n"]
+        # Ensure 'invoice_date' exists and is datetime type before min/max
+        if 'invoice_date' in data.columns and pd.api.types.is_datetime64_any_dtype(data['invoice_date']):
+            valid_dates = data['invoice_date'].dropna()
+            if not valid_dates.empty:
+                min_date, max_date = valid_dates.agg(['min', 'max'])
+                lines.append(f"  Period: {min_date.strftime('%d/%m/%Y')} to {max_date.strftime('%d/%m/%Y')}\n")
             else:
-                summary += "  Period: N/A (Invoice date column missing or invalid)\n"
-
-            summary += f"  Total Taxable Value: ₹{self.gstr2a_data['taxable_value'].sum():,.2f}\n"
-            total_tax_gstr2a = (self.gstr2a_data['cgst'].sum() if 'cgst' in self.gstr2a_data.columns else 0) + \
-                               (self.gstr2a_data['sgst'].sum() if 'sgst' in self.gstr2a_data.columns else 0) + \
-                               (self.gstr2a_data['igst'].sum() if 'igst' in self.gstr2a_data.columns else 0)
-            summary += f"  Total Tax: ₹{total_tax_gstr2a:,.2f}\n"
-            if 'supplier_gstin' in self.gstr2a_data.columns:
-                summary += f"  Unique Suppliers: {self.gstr2a_data['supplier_gstin'].nunique()}\n"
-        
-        # Books summary
-        summary += "\nBooks Data:\n"
-        if self.books_data.empty:
-            summary += "  No data loaded\n"
+                lines.append("  Period: N/A (No valid dates)\n")
         else:
-            summary += f"  Records: {len(self.books_data)}\n"
-            # Ensure 'invoice_date' exists and is datetime type before min/max
-            if 'invoice_date' in self.books_data.columns and pd.api.types.is_datetime64_any_dtype(self.books_data['invoice_date']):
-                valid_dates = self.books_data['invoice_date'].dropna()
-                if not valid_dates.empty:
-                    min_date = valid_dates.min()
-                    max_date = valid_dates.max()
-                    summary += f"  Period: {min_date.strftime('%d/%m/%Y')} to {max_date.strftime('%d/%m/%Y')}\n"
-                else:
-                    summary += "  Period: N/A (No valid dates)\n"
+            lines.append("  Period: N/A (Invoice date column missing or invalid)\n")
+
+        lines.append(f"  Total Taxable Value: ₹{data['taxable_value'].sum():,.2f}\n")
+        # One NumPy reduction over the tax columns instead of a .sum() per column
+        tax_cols = [col for col in ('cgst', 'sgst', 'igst') if col in data.columns]
+        total_tax = np.nansum(data[tax_cols].to_numpy(dtype=float)) if tax_cols else 0.0
+        lines.append(f"  Total Tax: ₹{total_tax:,.2f}\n")
+        if 'supplier_gstin' in data.columns:
+            gstins = data['supplier_gstin']
+            if isinstance(gstins.dtype, pd.CategoricalDtype):
+                # Count the category codes in use (-1 marks a missing GSTIN) instead of hashing the strings
+                codes = gstins.cat.codes.to_numpy()
+                unique_suppliers = np.count_nonzero(np.bincount(codes[codes >= 0], minlength=1))
             else:
-                summary += "  Period: N/A (Invoice date column missing or invalid)\n"
+                unique_suppliers = len(pd.unique(gstins.dropna().to_numpy()))
+            lines.append(f"  Unique Suppliers: {unique_suppliers}\n")
+        return lines
 
-            summary += f"  Total Taxable Value: ₹{self.books_data['taxable_value'].sum():,.2f}\n"
-            total_tax_books = (self.books_data['cgst'].sum() if 'cgst' in self.books_data.columns else 0) + \
-                              (self.books_data['sgst'].sum() if 'sgst' in self.books_data.columns else 0) + \
-                              (self.books_data['igst'].sum() if 'igst' in self.books_data.columns else 0)
-            summary += f"  Total Tax: ₹{total_tax_books:,.2f}\n"
-            if 'supplier_gstin' in self.books_data.columns:
-                summary += f"  Unique Suppliers: {self.books_data['supplier_gstin'].nunique()}\n"
+    def show_data_summary(self):
+        """Displays a summary of the loaded GSTR-2A and Books data in a new dialog."""
+        parts = ["=== Data Summary ===\n\n"] # Joined once at the end instead of growing a string
+        
+        # GSTR-2A and Books summaries, recomputed only when the dataset's version changed since the
+        # dialog was last opened. Reading the data first folds in any pending rows (bumping the version)
+        for heading, source, data in (("GSTR-2A Data:\n", 'gstr2a', self.gstr2a_data),
+                                      ("\nBooks Data:\n", 'books', self.books_data)):
+            version = self._data_versions[source]
+            cached = self._summary_sections.get(source)
+            if cached is None or cached[0] != version:
+                cached = self._summary_sections[source] = (version, self._data_summary_lines(data))
+            parts.append(heading)
+            parts.extend(cached[1])
         
         # Reconciliation summary
-        summary += "\nReconciliation Status:\n"
+        parts.append("\nReconciliation Status:\n")
         if self.reconciliation_results is None:
-            summary += "  Not performed yet. Click 'Run Reconciliation' to see results.\n"
+            parts.append("  Not performed yet. Click 'Run Reconciliation' to see results.\n")
         else:
-            summary += f"  Last Run: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
-            summary += f"  Discrepancies Found: {len(self.reconciliation_results)}\n"
+            parts.append(f"  Last Run: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
+            parts.append(f"  Discrepancies Found: {len(self.reconciliation_results)}\n")
             if not self.reconciliation_results.empty:
-                summary += f"  Total Amount Discrepancy: ₹{self.reconciliation_results['Amount Diff'].sum():,.2f}\n"
-                summary += f"  Total Tax Discrepancy: ₹{self.reconciliation_results['Tax Diff'].sum():,.2f}\n"
-        
-        # Create a new Toplevel window for the summary dialog
-        summary_dialog = tk.Toplevel(self.root)
-        summary_dialog.title("Data Summary")
-        summary_dialog.geometry("600x500")
-        
-        # Add a ScrolledText widget to display the summary
-        text = scrolledtext.ScrolledText(summary_dialog, wrap=tk.WORD)
-        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        text.insert(tk.END, summary)
+                parts.append(f"  Total Amount Discrepancy: ₹{self.reconciliation_results['Amount Diff'].sum():,.2f}\n")
+                parts.append(f"  Total Tax Discrepancy: ₹{self.reconciliation_results['Tax Diff'].sum():,.2f}\n")
+        
+        if self._summary_dialog is None:
+            # Create the Toplevel window for the summary dialog on first use
+            summary_dialog = tk.Toplevel(self.root)
+            summary_dialog.title("Data Summary")
+            summary_dialog.geometry("600x500")
+            # Closing only hides the dialog so reopening it skips building the widgets again
+            summary_dialog.protocol("WM_DELETE_WINDOW", summary_dialog.withdraw)
+            
+            # Add a ScrolledText widget to display the summary
+            self._summary_text = scrolledtext.ScrolledText(summary_dialog, wrap=tk.WORD)
+            self._summary_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            
+            # Add a close button
+            ttk.Button(summary_dialog, text="Close", command=summary_dialog.withdraw).pack(pady=10)
+            self._summary_dialog = summary_dialog
+        
+        text = self._summary_text
+        text.config(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        text.insert(tk.END, "".join(parts))
         text.config(state=tk.DISABLED) # Make the text read-only
-        
-        # Add a close button
-        ttk.Button(summary_dialog, text="Close", command=summary_dialog.destroy).pack(pady=10)
+        self._summary_dialog.deiconify()
+        self._summary_dialog.lift()
+
+    def run_in_background(self, job, work, on_done, *args):
+        """
+        Runs work(*args) on the worker pool so the Tk event loop stays responsive.
+        The finished future is handed to on_done on the Tk main thread. job names the work; while a
+        job of that name is still running nothing is started and False is returned.
+        """
+        if job in self._running:
+            return False
+        future = self._pool.submit(work, *args)
+        self._running[job] = future
+        future.add_done_callback(lambda f: self._post_result(job, on_done, f))
+        return True
+
+    def _post_result(self, job, on_done, future):
+        # Runs on the worker thread; hand over to Tk unless the window is already gone
+        if self._closing:
+            return
+        try:
+            self.root.after(0, self._finish_job, job, on_done, future)
+        except (RuntimeError, tk.TclError):
+            pass # The main loop ended while the job was finishing
+
+    def _finish_job(self, job, on_done, future):
+        del self._running[job]
+        on_done(future)
+
+    def on_close(self):
+        """Cancels queued background work and closes the application without waiting for running jobs."""
+        self._closing = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     def log_message(self, message, error=False):
         """
-        Logs a message to the application's log text area and updates the status bar.
-        Messages marked as errors are displayed in red.
+        Queues a message for the application's log text area and the status bar.
+        Messages marked as errors are displayed in red. Safe to call from worker threads.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        
-        self.log_text.config(state=tk.NORMAL) # Enable editing
-        if error:
-            self.log_text.tag_config("error", foreground="red") # Configure error tag
-            self.log_text.insert(tk.END, log_entry, "error") # Insert with error tag
-        else:
-            self.log_text.insert(tk.END, log_entry) # Insert normal message
-        self.log_text.config(state=tk.DISABLED) # Disable editing
-        self.log_text.see(tk.END) # Scroll to the end of the log
-        
-        # Update status bar with the latest message
-        self.status_var.set(message)
+        now = time.localtime()
+        self._log_buf.append((LOG_ENTRY_FORMAT(now.tm_hour, now.tm_min, now.tm_sec, message), error, message))
+        # Errors are shown right away rather than on the next tick; widgets may only be touched from the Tk thread
+        if error and threading.current_thread() is threading.main_thread():
+            self._flush_log()
+
+    def _flush_log_loop(self):
+        """Flushes the log queue, then reschedules itself."""
+        self._flush_log()
+        self.root.after(LOG_FLUSH_MS, self._flush_log_loop)
+
+    def _flush_log(self):
+        """Writes queued log entries to the log widget in one batch."""
+        if self._log_buf:
+            batch = []
+            while self._log_buf:
+                batch.append(self._log_buf.popleft())
+            
+            # A single insert call with alternating (text, tags) pairs
+            chunks = []
+            for log_entry, error, _ in batch:
+                chunks.extend((log_entry, ("error",) if error else ()))
+            self.log_text.config(state=tk.NORMAL) # Enable editing
+            self.log_text.insert(tk.END, *chunks)
+            # Keep the widget itself bounded so long sessions do not slow down text layout
+            self.log_text.delete("1.0", f"end-{LOG_MAX_LINES + 1}l")
+            self.log_text.config(state=tk.DISABLED) # Disable editing
+            self.log_text.see(tk.END) # Scroll to the end of the log
+            
+            # Update status bar with the latest message
+            self.status_var.set(batch[-1][2])
 
 # Main part of the script to run the application
 if __name__ == "__main__":